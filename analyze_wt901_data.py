@@ -6,6 +6,26 @@ Analyze WT901BLE68 raw BLE data to understand frame structure
 import struct
 import numpy as np
 
+# Precompiled little-endian layouts (format strings are parsed once)
+_ACC_TEMP = struct.Struct('<4h')  # AccX, AccY, AccZ, Temp of a 0x51 frame
+
+# Conversion from raw int16 counts to g (±16g full scale)
+ACC_SCALE = np.float32(16.0 / 32768.0)
+
+def decode_extended_frames(notifications):
+    """
+    Decode 16-byte 0x55 0x61 notifications in a single numpy pass.
+    Returns an (N, 3) float32 array of AccX, AccY, AccZ in g.
+    """
+    frames = [data for data in notifications
+              if len(data) == 16 and data[0] == 0x55 and data[1] == 0x61]
+    if not frames:
+        return np.empty((0, 3), dtype=np.float32)
+    
+    # 16 bytes per frame = 8 little-endian int16s; word 0 is the header
+    words = np.frombuffer(b''.join(frames), dtype='<i2').reshape(-1, 8)
+    return words[:, 1:4].astype(np.float32) * ACC_SCALE
+
 def analyze_raw_data():
     """Analyze the raw BLE notifications from the WT901BLE68"""
     
@@ -35,10 +55,11 @@ def analyze_raw_data():
             print("  -> Standard WT901 IMU frame (0x55 0x51)")
             if len(data) >= 11:
                 # Parse as standard 11-byte frame
-                acc_x = struct.unpack('<h', data[2:4])[0] / 32768.0 * 16
-                acc_y = struct.unpack('<h', data[4:6])[0] / 32768.0 * 16
-                acc_z = struct.unpack('<h', data[6:8])[0] / 32768.0 * 16
-                temp = struct.unpack('<h', data[8:10])[0] / 340.0 + 36.53
+                raw_x, raw_y, raw_z, raw_temp = _ACC_TEMP.unpack_from(data, 2)
+                acc_x = raw_x / 32768.0 * 16
+                acc_y = raw_y / 32768.0 * 16
+                acc_z = raw_z / 32768.0 * 16
+                temp = raw_temp / 340.0 + 36.53
                 print(f"    AccX: {acc_x:.3f}g, AccY: {acc_y:.3f}g, AccZ: {acc_z:.3f}g")
                 print(f"    Temp: {temp:.1f}°C")
         elif data[0] == 0x55 and data[1] == 0x61:
@@ -49,11 +70,13 @@ def analyze_raw_data():
             print("  -> Attempting to extract acceleration data...")
             
             # Method 1: Look for 16-bit values that could be acceleration
-            for pos in range(2, min(14, len(data)), 2):
-                if pos + 1 < len(data):
-                    val = struct.unpack('<h', data[pos:pos+2])[0]
-                    acc_g = val / 32768.0 * 16  # Standard WT901 scaling
-                    print(f"    Pos {pos}-{pos+1}: {val} -> {acc_g:.3f}g")
+            # Zero-copy int16 view of the payload (native order; the sensor
+            # sends little-endian, as are the hosts this runs on)
+            payload = memoryview(data)[2:]
+            values = payload[:len(payload) // 2 * 2].cast('h')
+            for pos, val in zip(range(2, 14, 2), values):
+                acc_g = val / 32768.0 * 16  # Standard WT901 scaling
+                print(f"    Pos {pos}-{pos+1}: {val} -> {acc_g:.3f}g")
             
             # Method 2: Check if this is a packed format with multiple readings
             if len(data) == 16:  # 160 bytes would be 10 frames of 16 bytes each
@@ -61,6 +84,13 @@ def analyze_raw_data():
                 
         print()
     
+    print("=== Batch Decode (all 0x61 frames) ===")
+    acc = decode_extended_frames(raw_notifications)
+    acc_total = np.sqrt((acc * acc).sum(axis=1))
+    for i, ((acc_x, acc_y, acc_z), total) in enumerate(zip(acc, acc_total), 1):
+        print(f"  Frame {i}: AccX: {acc_x:.3f}g, AccY: {acc_y:.3f}g, AccZ: {acc_z:.3f}g | Acc_total: {total:.3f}g")
+    print()
+    
     print("=== Analysis Summary ===")
     print("1. Device is sending 0x55 0x61 frames (not standard 0x55 0x51)")
     print("2. Each notification appears to be 16 bytes (not 160 as initially thought)")
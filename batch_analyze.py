@@ -5,18 +5,36 @@ Processes all vibration log files in the data directory.
 """
 
 import os
-import glob
-from calcvib import analyze_vibration_data, compare_to_baseline, log_results
-import pandas as pd
+import csv
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from calcvib import analyze_vibration_data, compare_to_baseline, LogWriter
 from datetime import datetime
 
-def process_all_files(data_dir="data", output_file="vibration_log.csv"):
+def analyze_file(file_path):
+    """
+    Analyze one log file and compare it to baseline.
+    Runs in a worker process, so it does no logging of its own.
+    """
+    # Parsed columns are cached next to the log
+    analysis = analyze_vibration_data(file_path, cache=True)
+    comparison = compare_to_baseline(analysis['mean_acc'], analysis['notes'])
+    
+    # Combine results
+    return {
+        'filename': str(file_path),
+        **analysis,
+        **comparison
+    }
+
+def process_all_files(data_dir="data", output_file="vibration_log.csv", max_workers=None):
     """
     Process all .txt files in the data directory.
+    Files are analyzed in parallel worker processes; results keep file order.
     """
-    # Find all .txt files in data directory
-    pattern = os.path.join(data_dir, "*.txt")
-    files = glob.glob(pattern)
+    # Find all .txt files in data directory (sorted once, up front)
+    files = sorted(Path(data_dir).glob("*.txt"))
     
     if not files:
         print(f"No .txt files found in {data_dir}/")
@@ -25,34 +43,34 @@ def process_all_files(data_dir="data", output_file="vibration_log.csv"):
     print(f"Found {len(files)} files to process...")
     print("=" * 60)
     
-    results = []
+    results = [None] * len(files)
     
-    for i, file_path in enumerate(sorted(files), 1):
-        try:
-            print(f"Processing {i}/{len(files)}: {os.path.basename(file_path)}")
-            
-            # Analyze the file
-            analysis = analyze_vibration_data(file_path)
-            comparison = compare_to_baseline(analysis['mean_acc'], analysis['notes'])
-            
-            # Combine results
-            file_results = {
-                'filename': file_path,
-                **analysis,
-                **comparison
-            }
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(analyze_file, file_path): i for i, file_path in enumerate(files)}
+        
+        for done, future in enumerate(as_completed(futures), 1):
+            i = futures[future]
+            file_path = files[i]
+            print(f"Processed {done}/{len(files)}: {os.path.basename(file_path)}")
             
-            results.append(file_results)
+            try:
+                file_results = future.result()
+            except Exception as e:
+                print(f"   ❌ Error processing {os.path.basename(file_path)}: {e}")
+                continue
             
-            # Log individual result
-            log_results(file_results, output_file)
+            results[i] = file_results
             
             # Show brief summary
-            status_icon = "🟢" if comparison['status'] == "Normal" else "🟡" if comparison['status'] == "ATTENTION" else "🔴"
-            print(f"   {status_icon} {analysis['mean_acc']:.3f}g ({comparison['status']})")
-            
-        except Exception as e:
-            print(f"   ❌ Error processing {os.path.basename(file_path)}: {e}")
+            status_icon = "🟢" if file_results['status'] == "Normal" else "🟡" if file_results['status'] == "ATTENTION" else "🔴"
+            print(f"   {status_icon} {file_results['mean_acc']:.3f}g ({file_results['status']})")
+    
+    results = [r for r in results if r is not None]
+    
+    # Log all results, in file order, through one buffered handle
+    with LogWriter(output_file) as log:
+        for file_results in results:
+            log.write(file_results)
     
     print("=" * 60)
     print(f"✅ Processed {len(results)} files successfully")
@@ -60,6 +78,13 @@ def process_all_files(data_dir="data", output_file="vibration_log.csv"):
     
     return results
 
+def _to_float(value):
+    """Parse a metadata string as a number, or None if it is not one."""
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
 def generate_summary_report(results, output_file="vibration_summary.csv"):
     """
     Generate a summary report with key insights.
@@ -68,7 +93,7 @@ def generate_summary_report(results, output_file="vibration_summary.csv"):
         print("No results to summarize")
         return
     
-    # Create summary DataFrame
+    # Build summary rows
     summary_data = []
     
     for r in results:
@@ -86,56 +111,70 @@ def generate_summary_report(results, output_file="vibration_summary.csv"):
             'Deviation_g': round(r['deviation'], 3)
         })
     
-    df = pd.DataFrame(summary_data)
-    
-    # Sort by file timestamp if available
-    if 'File_Timestamp' in df.columns and df['File_Timestamp'].notna().any():
-        df = df.sort_values('File_Timestamp')
+    # Sort by file timestamp if available (stable, so ties keep file order)
+    if any(row['File_Timestamp'] for row in summary_data):
+        summary_data.sort(key=lambda row: row['File_Timestamp'])
     
     # Save summary
-    df.to_csv(output_file, index=False)
+    with open(output_file, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=list(summary_data[0]), lineterminator='\n')
+        writer.writeheader()
+        writer.writerows(summary_data)
+    
+    # Single pass over the rows for all statistics
+    status_counts = Counter()
+    rpm_count = speed_count = 0
+    rpm_vals, speed_vals, mean_accs, peak_accs, warnings = [], [], [], [], []
+    for row in summary_data:
+        status_counts[row['Status']] += 1
+        if row['RPM'] != '':
+            rpm_count += 1
+            rpm = _to_float(row['RPM'])
+            if rpm is not None:
+                rpm_vals.append(rpm)
+        if row['Speed_knots'] != '':
+            speed_count += 1
+            speed = _to_float(row['Speed_knots'])
+            if speed is not None:
+                speed_vals.append(speed)
+        mean_accs.append(row['Mean_Acc_g'])
+        peak_accs.append(row['Peak_Acc_g'])
+        if row['Status'] == 'WARNING':
+            warnings.append(row)
     
     # Print summary statistics
     print("\n📋 SUMMARY STATISTICS:")
     print("=" * 40)
     
     # Status breakdown
-    status_counts = df['Status'].value_counts()
     print("Status Breakdown:")
-    for status, count in status_counts.items():
+    for status, count in status_counts.most_common():
         print(f"  {status}: {count}")
     
     # RPM analysis
-    rpm_data = df[df['RPM'].notna() & (df['RPM'] != '')].copy()
-    if not rpm_data.empty:
-        print(f"\nRPM Analysis ({len(rpm_data)} files):")
-        rpm_data['RPM'] = pd.to_numeric(rpm_data['RPM'], errors='coerce')
-        rpm_data = rpm_data.dropna(subset=['RPM'])
-        if not rpm_data.empty:
-            print(f"  Range: {rpm_data['RPM'].min():.0f} - {rpm_data['RPM'].max():.0f} RPM")
-            print(f"  Average: {rpm_data['RPM'].mean():.0f} RPM")
+    if rpm_count:
+        print(f"\nRPM Analysis ({rpm_count} files):")
+        if rpm_vals:
+            print(f"  Range: {min(rpm_vals):.0f} - {max(rpm_vals):.0f} RPM")
+            print(f"  Average: {sum(rpm_vals) / len(rpm_vals):.0f} RPM")
     
     # Speed analysis
-    speed_data = df[df['Speed_knots'].notna() & (df['Speed_knots'] != '')].copy()
-    if not speed_data.empty:
-        print(f"\nSpeed Analysis ({len(speed_data)} files):")
-        speed_data['Speed_knots'] = pd.to_numeric(speed_data['Speed_knots'], errors='coerce')
-        speed_data = speed_data.dropna(subset=['Speed_knots'])
-        if not speed_data.empty:
-            print(f"  Range: {speed_data['Speed_knots'].min():.1f} - {speed_data['Speed_knots'].max():.1f} knots")
-            print(f"  Average: {speed_data['Speed_knots'].mean():.1f} knots")
+    if speed_count:
+        print(f"\nSpeed Analysis ({speed_count} files):")
+        if speed_vals:
+            print(f"  Range: {min(speed_vals):.1f} - {max(speed_vals):.1f} knots")
+            print(f"  Average: {sum(speed_vals) / len(speed_vals):.1f} knots")
     
     # Vibration trends
     print(f"\nVibration Trends:")
-    print(f"  Mean acceleration range: {df['Mean_Acc_g'].min():.3f} - {df['Mean_Acc_g'].max():.3f} g")
-    print(f"  Average mean acceleration: {df['Mean_Acc_g'].mean():.3f} g")
-    print(f"  Peak acceleration range: {df['Peak_Acc_g'].min():.3f} - {df['Peak_Acc_g'].max():.3f} g")
+    print(f"  Mean acceleration range: {min(mean_accs):.3f} - {max(mean_accs):.3f} g")
+    print(f"  Average mean acceleration: {sum(mean_accs) / len(mean_accs):.3f} g")
+    print(f"  Peak acceleration range: {min(peak_accs):.3f} - {max(peak_accs):.3f} g")
     
     # Warnings
-    warnings = df[df['Status'] == 'WARNING']
-    if not warnings.empty:
+    if warnings:
         print(f"\n⚠️  WARNINGS ({len(warnings)} files):")
-        for _, row in warnings.iterrows():
+        for row in warnings:
             print(f"  {row['File']}: {row['Mean_Acc_g']:.3f}g ({row['Deviation_g']:+.3f}g deviation)")
     
     print(f"\n📄 Summary saved to: {output_file}")
@@ -9,9 +9,43 @@ import numpy as np
 import sys
 import re
 import os
+import csv
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+    import pyarrow.feather as feather
+except ImportError:  # pyarrow is optional; fall back to the pandas parser
+    pa = None
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to the numpy kernel
+    njit = None
+
+ACC_COLUMNS = ['AccX(g)', 'AccY(g)', 'AccZ(g)']
+TIME_COLUMN = 'time'
+
+# Sensor timestamps look like '2025-6-28 8:52:12.422' (fraction optional);
+# rows whose time doesn't parse are dropped. Without pyarrow the check is
+# the pattern alone (field ranges, not calendar days)
+_TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+_TIME_PATTERN = (r'\d{4}-(?:0?[1-9]|1[0-2])-(?:0?[1-9]|[12]\d|3[01]) '
+                 r'(?:[01]?\d|2[0-3]):[0-5]?\d:[0-5]?\d(?:\.\d+)?$')
+
+# Rows per streamed chunk; keeps peak memory flat for multi-hour logs
+CHUNK_ROWS = 200_000
+_ROW_BYTES = 200  # approx. length of one WT901BLE68 log line
+
+# Filename patterns, compiled once for batch runs over many files
+_TS_RE = re.compile(r'(\d{14})')
+_RPM_RE = re.compile(r'(\d+)\s*rpm', re.IGNORECASE)
+_SPEED_RE = re.compile(r'(\d+(?:\.\d+)?)\s*knots?', re.IGNORECASE)
+_CLEAN_RE = re.compile(r'[._-]+')
+
 def extract_metadata_from_filename(filename):
     """
     Extract RPM, speed, and notes from filename patterns like:
@@ -21,40 +55,47 @@ def extract_metadata_from_filename(filename):
     """
     basename = os.path.basename(filename)
     
-    # Extract timestamp from filename (first 14 digits)
-    timestamp_match = re.search(r'(\d{14})', basename)
+    # Extract timestamp from filename (first 14 digits); logger files start
+    # with it, so try a plain slice before falling back to the regex
+    if basename[:14].isdigit():
+        timestamp_str = basename[:14]
+    else:
+        timestamp_match = _TS_RE.search(basename)
+        timestamp_str = timestamp_match.group(1) if timestamp_match else None
     file_timestamp = None
-    if timestamp_match:
+    if timestamp_str:
         try:
-            timestamp_str = timestamp_match.group(1)
-            file_timestamp = datetime.strptime(timestamp_str, '%Y%m%d%H%M%S')
+            # Fixed YYYYMMDDHHMMSS layout; direct construction skips strptime
+            file_timestamp = datetime(int(timestamp_str[0:4]), int(timestamp_str[4:6]),
+                                      int(timestamp_str[6:8]), int(timestamp_str[8:10]),
+                                      int(timestamp_str[10:12]), int(timestamp_str[12:14]))
         except ValueError:
             pass
     
     # Extract RPM
-    rpm_match = re.search(r'(\d+)\s*rpm', basename, re.IGNORECASE)
+    rpm_match = _RPM_RE.search(basename)
     rpm = rpm_match.group(1) if rpm_match else None
     
     # Extract speed (knots)
-    speed_match = re.search(r'(\d+(?:\.\d+)?)\s*knots?', basename, re.IGNORECASE)
+    speed_match = _SPEED_RE.search(basename)
     speed = speed_match.group(1) if speed_match else None
     
     # Extract notes (everything after timestamp, excluding RPM/speed)
     notes_parts = []
     if file_timestamp:
         # Remove timestamp from notes
-        notes_text = basename.replace(timestamp_match.group(1), '').strip()
+        notes_text = basename.replace(timestamp_str, '').strip()
     else:
         notes_text = basename
     
     # Remove RPM and speed from notes
     if rpm:
-        notes_text = re.sub(r'\d+\s*rpm', '', notes_text, flags=re.IGNORECASE)
+        notes_text = _RPM_RE.sub('', notes_text)
     if speed:
-        notes_text = re.sub(r'\d+(?:\.\d+)?\s*knots?', '', notes_text, flags=re.IGNORECASE)
+        notes_text = _SPEED_RE.sub('', notes_text)
     
     # Clean up notes
-    notes_text = re.sub(r'[._-]+', ' ', notes_text).strip()
+    notes_text = _CLEAN_RE.sub(' ', notes_text).strip()
     notes = notes_text if notes_text else None
     
     return {
@@ -64,35 +105,174 @@ def extract_metadata_from_filename(filename):
         'notes': notes
     }
 
-def analyze_vibration_data(file_path):
+def read_acc_columns(file_path, cache=False):
+    """
+    Read the AccX/AccY/AccZ columns of a WT901BLE68 log as numpy arrays.
+    Rows missing any acceleration value or with an invalid timestamp are dropped.
+    With cache=True the parsed columns are kept in a '<file>.feather' sidecar
+    which is reused for as long as it is newer than the log itself.
+    """
+    if not cache or pa is None:
+        return _parse_acc_columns(file_path)
+    
+    cache_path = f"{file_path}.feather"
+    if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(file_path):
+        table = feather.read_table(cache_path, memory_map=True)
+        return tuple(table.column(col).to_numpy() for col in ACC_COLUMNS)
+    
+    columns = _parse_acc_columns(file_path)
+    try:
+        feather.write_feather(pa.table(dict(zip(ACC_COLUMNS, columns))), cache_path,
+                              compression='uncompressed')
+    except (OSError, pa.ArrowException):
+        # Cache is best-effort; the log was parsed fine. Don't leave a
+        # partly written sidecar behind to be read next time
+        try:
+            os.remove(cache_path)
+        except OSError:
+            pass
+    return columns
+
+if pa is not None:
+    # A log cut off mid-write ends in a short row; skip it (pandas would
+    # pad it with NaN, which _finite_rows drops anyway) rather than failing
+    _PARSE_OPTIONS = pacsv.ParseOptions(delimiter='\t', invalid_row_handler=lambda row: 'skip')
+    # The time column stays a string; it is only checked, never converted
+    _CONVERT_OPTIONS = pacsv.ConvertOptions(
+        include_columns=[TIME_COLUMN] + ACC_COLUMNS,
+        column_types={TIME_COLUMN: pa.string(), **{col: pa.float32() for col in ACC_COLUMNS}}
+    )
+
+def _valid_times_arrow(times):
+    """Mask of the Arrow time strings that parse as timestamps."""
+    # Arrow's strptime has no fractional seconds, so the fraction is cut first
+    seconds = pc.replace_substring_regex(times, r'\.\d+$', '')
+    parsed = pc.strptime(seconds, format=_TIME_FORMAT, unit='s', error_is_null=True)
+    return np.asarray(pc.is_valid(parsed))
+
+def _valid_times_pandas(times):
+    """Mask of the time strings in a pandas Series that look like timestamps."""
+    return times.str.match(_TIME_PATTERN, na=False).to_numpy()
+
+def _finite_rows(ax, ay, az, valid):
+    """
+    Drop rows where any acceleration value is missing (NaN) or not finite,
+    or whose timestamp is invalid (valid is False).
+    """
+    mask = np.isfinite(ax) & np.isfinite(ay) & np.isfinite(az) & valid
+    if mask.all():
+        return ax, ay, az
+    return ax[mask], ay[mask], az[mask]
+
+def iter_acc_chunks(file_path, chunksize=CHUNK_ROWS):
+    """
+    Yield the AccX/AccY/AccZ columns of a log as (ax, ay, az) numpy arrays,
+    roughly chunksize rows at a time, so huge logs never load all at once.
+    Rows are filtered exactly as in read_acc_columns.
+    """
+    if pa is not None:
+        reader = pacsv.open_csv(
+            file_path,
+            read_options=pacsv.ReadOptions(block_size=chunksize * _ROW_BYTES),
+            parse_options=_PARSE_OPTIONS,
+            convert_options=_CONVERT_OPTIONS
+        )
+        for batch in reader:
+            yield _finite_rows(*(batch.column(col).to_numpy(zero_copy_only=False) for col in ACC_COLUMNS),
+                               _valid_times_arrow(batch.column(TIME_COLUMN)))
+        return
+    
+    for df in pd.read_csv(file_path, sep='\t', usecols=[TIME_COLUMN] + ACC_COLUMNS,
+                          dtype={TIME_COLUMN: str, **{col: np.float32 for col in ACC_COLUMNS}},
+                          chunksize=chunksize):
+        yield _finite_rows(*(df[col].to_numpy() for col in ACC_COLUMNS),
+                           _valid_times_pandas(df[TIME_COLUMN]))
+
+def _parse_acc_columns(file_path):
+    """Parse the acceleration columns out of a tab-separated log."""
+    if pa is not None:
+        # Multi-threaded C++ parser; only the columns we need are converted
+        # (nulls come back as NaN and are masked out below)
+        table = pacsv.read_csv(file_path, parse_options=_PARSE_OPTIONS,
+                               convert_options=_CONVERT_OPTIONS)
+        return _finite_rows(*(table.column(col).to_numpy() for col in ACC_COLUMNS),
+                            _valid_times_arrow(table.column(TIME_COLUMN)))
+    
+    # Read tab-separated data
+    # float32 is ample for ±16g sensor readings and halves memory traffic.
+    # The time column is only checked for a valid timestamp, not converted.
+    df = pd.read_csv(file_path, sep='\t', usecols=[TIME_COLUMN] + ACC_COLUMNS,
+                     dtype={TIME_COLUMN: str, **{col: np.float32 for col in ACC_COLUMNS}})
+    
+    return _finite_rows(*(df[col].to_numpy() for col in ACC_COLUMNS),
+                        _valid_times_pandas(df[TIME_COLUMN]))
+
+def _acc_moments_numpy(ax, ay, az):
+    """Mean, sum of squared deviations (M2) and peak of the acceleration magnitude."""
+    # Accumulate in place so only one float32 buffer is allocated
+    acc_total = np.multiply(ax, ax, dtype=np.float32)
+    acc_total += ay * ay
+    acc_total += az * az
+    np.sqrt(acc_total, out=acc_total)
+    return float(acc_total.mean()), float(acc_total.var()) * acc_total.size, float(acc_total.max())
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _acc_moments(ax, ay, az):
+        """
+        Mean, M2 and peak of the acceleration magnitude in one fused pass
+        over the three columns (Welford's algorithm for the variance).
+        """
+        n = 0
+        mean = 0.0
+        m2 = 0.0
+        peak = 0.0
+        for i in range(ax.shape[0]):
+            acc = np.sqrt(ax[i] * ax[i] + ay[i] * ay[i] + az[i] * az[i])
+            n += 1
+            delta = acc - mean
+            mean += delta / n
+            m2 += delta * (acc - mean)
+            if acc > peak:
+                peak = acc
+        return mean, m2, peak
+else:
+    _acc_moments = _acc_moments_numpy
+
+def _merge_moments(a, b):
+    """
+    Combine two (n, mean, M2, peak) accumulators (Chan et al. parallel
+    variance update; stable, unlike the sum/sum-of-squares shortcut).
+    """
+    n_a, mean_a, m2_a, peak_a = a
+    n_b, mean_b, m2_b, peak_b = b
+    n = n_a + n_b
+    delta = mean_b - mean_a
+    mean = mean_a + delta * n_b / n
+    m2 = m2_a + m2_b + delta * delta * n_a * n_b / n
+    return n, mean, m2, max(peak_a, peak_b)
+
+def analyze_vibration_data(file_path, cache=False):
     """
     Analyze vibration data from WT901BLE68 sensor log file.
     Returns calculated metrics and metadata.
+    The log is streamed in chunks unless cache=True, where the whole
+    (cached) column set is read at once.
     """
     try:
-        # Read tab-separated data
-        df = pd.read_csv(file_path, sep='\t')
-        
-        # Parse timestamp column
-        df['time'] = pd.to_datetime(df['time'], errors='coerce')
-        
-        # Drop rows with invalid timestamps
-        df = df.dropna(subset=['time'])
+        chunks = [read_acc_columns(file_path, cache=True)] if cache else iter_acc_chunks(file_path)
         
-        if df.empty:
-            raise ValueError("No valid data rows found after timestamp parsing")
+        # Calculate total acceleration magnitude statistics chunk by chunk
+        moments = (0, 0.0, 0.0, 0.0)
+        for ax, ay, az in chunks:
+            if ax.size:
+                chunk_moments = (ax.size, *(float(v) for v in _acc_moments(ax, ay, az)))
+                moments = _merge_moments(moments, chunk_moments)
         
-        # Calculate total acceleration magnitude
-        df['Acc_total'] = np.sqrt(
-            df['AccX(g)']**2 + 
-            df['AccY(g)']**2 + 
-            df['AccZ(g)']**2
-        )
-        
-        # Calculate statistics
-        mean_vib = df['Acc_total'].mean()
-        std_vib = df['Acc_total'].std()
-        peak_vib = df['Acc_total'].max()
+        sample_count, mean_vib, m2, peak_vib = moments
+        if sample_count == 0:
+            raise ValueError("No valid data rows found")
+        std_vib = float(np.sqrt(m2 / (sample_count - 1))) if sample_count > 1 else float('nan')
         
         # Calculate sample duration (assuming 30-second samples)
         duration = 30.0  # seconds
@@ -104,7 +284,7 @@ def analyze_vibration_data(file_path):
             'mean_acc': mean_vib,
             'std_dev': std_vib,
             'peak_acc': peak_vib,
-            'sample_count': len(df),
+            'sample_count': int(sample_count),
             'duration': duration,
             'file_timestamp': metadata['file_timestamp'],
             'rpm': metadata['rpm'],
@@ -115,24 +295,30 @@ def analyze_vibration_data(file_path):
     except Exception as e:
         raise ValueError(f"Error processing file {file_path}: {str(e)}")
 
+# Allora-specific baselines
+IDLE_BASELINE = 1.01  # g
+CRUISE_BASELINE = 1.03  # g
+SIGNIFICANT_INCREASE = 0.2  # g
+
+# Note words that select the expected operating condition (matched as
+# substrings, so "idle," and "engineroom" count)
+_IDLE_WORDS = ('idle', 'engine')
+_CRUISE_WORDS = ('cruise', 'moving', 'knots')
+
 def compare_to_baseline(mean_acc, notes):
     """
     Compare current reading to Allora baselines.
     Returns status and recommendation.
     """
-    # Allora-specific baselines
-    IDLE_BASELINE = 1.01  # g
-    CRUISE_BASELINE = 1.03  # g
-    SIGNIFICANT_INCREASE = 0.2  # g
-    
     status = "Normal"
     recommendation = "Continue monitoring"
     
-    # Determine expected baseline based on notes
-    if notes and any(word in notes.lower() for word in ['idle', 'engine']):
+    # Determine expected baseline from the words in the notes (lowercased once)
+    notes = notes.lower() if notes else ""
+    if any(word in notes for word in _IDLE_WORDS):
         baseline = IDLE_BASELINE
         condition = "idle"
-    elif notes and any(word in notes.lower() for word in ['cruise', 'moving', 'knots']):
+    elif any(word in notes for word in _CRUISE_WORDS):
         baseline = CRUISE_BASELINE
         condition = "cruising"
     else:
@@ -159,13 +345,20 @@ def compare_to_baseline(mean_acc, notes):
         'recommendation': recommendation
     }
 
-def log_results(results, log_file="vibration_log.csv"):
-    """
-    Append results to vibration log CSV file.
-    """
-    now = datetime.now()
-    
-    log_entry = {
+LOG_FIELDS = [
+    'Timestamp', 'File', 'File_Timestamp', 'Mean_Acc_g', 'Std_Dev_g', 'Peak_Acc_g',
+    'RPM', 'Speed_knots', 'Notes', 'Status', 'Baseline_g', 'Deviation_g', 'Recommendation'
+]
+
+def _csv_field(value):
+    """Empty field for a missing (None or NaN) value, as DataFrame.to_csv writes it."""
+    if value is None or (isinstance(value, float) and value != value):
+        return ''
+    return value
+
+def _log_entry(results, now):
+    """Build one vibration_log.csv row from a combined results dict."""
+    entry = {
         'Timestamp': now.strftime('%Y-%m-%d %H:%M:%S'),
         'File': results['filename'],
         'File_Timestamp': results['file_timestamp'].strftime('%Y-%m-%d %H:%M:%S') if results['file_timestamp'] else '',
@@ -180,17 +373,75 @@ def log_results(results, log_file="vibration_log.csv"):
         'Deviation_g': round(results['deviation'], 3),
         'Recommendation': results['recommendation']
     }
+    return {key: _csv_field(value) for key, value in entry.items()}
+
+class LogWriter:
+    """
+    Append rows to the vibration log CSV through one buffered file handle.
+    Use as a context manager and call write() once per results dict.
+    """
+    
+    def __init__(self, log_file="vibration_log.csv"):
+        self.log_file = log_file
+        self._file = None
+        self._writer = None
     
-    # Create DataFrame and append to CSV
-    log_df = pd.DataFrame([log_entry])
+    def __enter__(self):
+        self._file = open(self.log_file, 'a', newline='', buffering=1 << 20)
+        self._writer = csv.DictWriter(self._file, fieldnames=LOG_FIELDS, extrasaction='ignore',
+                                      lineterminator='\n')
+        # Append mode starts at end of file, so position 0 means a new (or
+        # empty) log; checked once here rather than stat()ing per write
+        if self._file.tell() == 0:
+            self._writer.writeheader()
+        return self
     
-    # Check if file exists to determine header
-    file_exists = os.path.exists(log_file)
+    def write(self, results):
+        """Append one combined results dict as a log row."""
+        self._writer.writerow(_log_entry(results, datetime.now()))
+    
+    def __exit__(self, exc_type, exc, tb):
+        self._file.close()
+        self._file = self._writer = None
+        return False
+
+def log_results(results, log_file="vibration_log.csv"):
+    """
+    Append results to vibration log CSV file.
+    Accepts a single results dict or a list of them.
+    """
+    if isinstance(results, dict):
+        results = [results]
+    if not results:
+        return log_file
     
-    log_df.to_csv(log_file, mode='a', index=False, header=not file_exists)
+    with LogWriter(log_file) as writer:
+        for r in results:
+            writer.write(r)
     
     return log_file
 
+def read_log(log_file="vibration_log.csv"):
+    """
+    Load the vibration log as a DataFrame.
+    The CSV stays the append-only source of truth (the live tools append to
+    it too); with pyarrow available a snappy parquet copy is kept alongside
+    and only rebuilt when the CSV has changed since it was written.
+    """
+    if pa is None:
+        return pd.read_csv(log_file)
+    
+    cache_path = os.path.splitext(log_file)[0] + '.parquet'
+    if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(log_file):
+        return pd.read_parquet(cache_path)
+    
+    df = pd.read_csv(log_file)
+    try:
+        df.to_parquet(cache_path, compression='snappy', index=False)
+    except (OSError, pa.ArrowException):
+        pass  # cache is best-effort; the CSV was read fine
+    return df
+
 def main():
     """Main function to process vibration log files."""
     if len(sys.argv) != 2:
@@ -1,10 +1,14 @@
 #!/usr/bin/env python3
 
-import pandas as pd
-import numpy as np
+import csv
+import os
 import sys
 from datetime import datetime
 
+# Use the shared analysis in the repo root calcvib.py (not this script)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from calcvib import analyze_vibration_data
+
 if len(sys.argv) != 2:
     print("Usage: ./calcvib.py <logfile.txt>")
     sys.exit(1)
@@ -12,36 +16,24 @@ if len(sys.argv) != 2:
 log_file = sys.argv[1]
 
 try:
-    df = pd.read_csv(log_file, sep="\t")
-    df['time'] = pd.to_datetime(df['time'], errors='coerce')
-    df = df.dropna(subset=['time'])
-
-    df['Acc_total'] = np.sqrt(
-        df['AccX(g)']**2 +
-        df['AccY(g)']**2 +
-        df['AccZ(g)']**2
-    )
-
-    mean_vib = df['Acc_total'].mean()
-    std_vib = df['Acc_total'].std()
-    peak_vib = df['Acc_total'].max()
+    results = analyze_vibration_data(log_file)
+    mean_vib = results['mean_acc']
+    std_vib = results['std_dev']
+    peak_vib = results['peak_acc']
 
     print(f"📊 File: {log_file}")
     print(f"Mean Acc (g): {mean_vib:.3f}")
     print(f"Std Dev (g): {std_vib:.3f}")
     print(f"Peak Acc (g): {peak_vib:.3f}")
 
-    # Append to log.csv
+    # Append to log.csv (short schema read by wt901_live_graph.py)
     now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    log_df = pd.DataFrame([{
-        "Timestamp": now,
-        "File": log_file,
-        "Mean Acc (g)": round(mean_vib, 3),
-        "Std Dev (g)": round(std_vib, 3),
-        "Peak Acc (g)": round(peak_vib, 3)
-    }])
-
-    log_df.to_csv("vibration_log.csv", mode='a', index=False, header=not pd.io.common.file_exists("vibration_log.csv"))
+    write_header = not os.path.exists("vibration_log.csv")
+    with open("vibration_log.csv", "a", newline="") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        if write_header:
+            writer.writerow(["Timestamp", "File", "Mean Acc (g)", "Std Dev (g)", "Peak Acc (g)"])
+        writer.writerow([now, log_file, round(mean_vib, 3), round(std_vib, 3), round(peak_vib, 3)])
 
 except Exception as e:
     print(f"Error: {e}")
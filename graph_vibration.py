@@ -4,13 +4,244 @@ Allora Yacht Vibration Graphing Tool
 Creates comprehensive visualizations of vibration data.
 """
 
+import sys
 import pandas as pd
+import matplotlib
+if '--show' not in sys.argv:
+    matplotlib.use('Agg')  # headless: plots are only written to PNG files
 import matplotlib.pyplot as plt
-import seaborn as sns
+from matplotlib.colors import to_rgba
+from matplotlib.lines import Line2D
 import numpy as np
 import re
 from datetime import datetime
+from types import SimpleNamespace
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
 import os
+import shutil
+import tempfile
+
+from calcvib import read_log
+
+try:
+    import polars as pl
+except ImportError:  # polars is optional; fall back to pandas parsing
+    pl = None
+
+try:
+    import xxhash
+except ImportError:  # xxhash is optional; hashlib's blake2b is the fallback
+    xxhash = None
+
+try:
+    import mpl_scatter_density  # registers the 'scatter_density' projection
+except ImportError:  # mpl-scatter-density is optional; dense plots use hexbin
+    mpl_scatter_density = None
+
+# Above this many points scatters are rasterized into a density image
+DENSE_POINTS = 10_000
+_DENSITY_CMAP = plt.get_cmap('viridis').with_extremes(under='none')
+
+# Marker plots with more points are thinned to about this many, keeping
+# every flagged point; the rest are capped per cell of a grid over the data
+SUBSAMPLE_POINTS = 5_000
+SUBSAMPLE_GRID = 64
+
+# Output resolution; PNGs are written with fast (level 1) zlib compression
+SAVE_DPI = 200
+DASHBOARD_DPI = 150
+
+# Generated plots are cached per log content under PLOT_CACHE_DIR/<hash>/
+PLOT_CACHE_DIR = '.plot_cache'
+PLOT_FILES = [
+    'vibration_time_series.png',
+    'vibration_status_breakdown.png',
+    'vibration_rpm_speed.png',
+    'vibration_location_analysis.png',
+    'vibration_dashboard.png'
+]
+
+def _save(fig, save_path, dpi=SAVE_DPI):
+    """Save a plot, then close the figure so its artists are freed."""
+    fig.savefig(save_path, dpi=dpi, bbox_inches='tight', pil_kwargs={'compress_level': 1})
+    plt.close(fig)
+
+def _show_plots():
+    """Open the generated PNG files in windows (main with --show)."""
+    for name in PLOT_FILES:
+        fig = plt.figure(name)
+        ax = fig.add_axes([0, 0, 1, 1])
+        ax.imshow(plt.imread(name))
+        ax.axis('off')
+    plt.show()
+
+# Line color cycle: the six-color husl palette, hardcoded so seaborn
+# isn't needed just to set it
+HUSL_PALETTE = ['#f77189', '#bb9832', '#50b131', '#36ada4', '#3ba3ec', '#e866f4']
+
+STATUS_COLORS = {'Normal': 'green', 'ATTENTION': 'orange', 'WARNING': 'red'}
+STATUS_CODES = {'Normal': 0, 'ATTENTION': 1, 'WARNING': 2}
+# Status colors as RGBA, so scatters get ready-made color arrays
+_STATUS_RGBA = {name: to_rgba(color) for name, color in STATUS_COLORS.items()}
+_NORMAL_RGBA = np.array(_STATUS_RGBA['Normal'], dtype=np.float32)
+_CODE_RGBA = np.array([_STATUS_RGBA['Normal']] + [_STATUS_RGBA[name] for name in STATUS_CODES],
+                      dtype=np.float32)  # indexed by code + 1
+
+# Sensor locations recognised in the notes; categories are kept in sorted
+# order so grouped output matches plain string grouping
+_LOC_RE = re.compile(r'(stern|salon|deck|coffee table|shaft)', re.IGNORECASE)
+LOCATIONS = ['coffee table', 'deck', 'other', 'salon', 'shaft', 'stern']
+
+def _precompute(df):
+    """
+    Masks and per-point arrays shared by the plotting functions, computed
+    once per DataFrame instead of once per plot.
+    status_code is -1 for statuses outside STATUS_CODES.
+    """
+    status = df['Status'].to_numpy()
+    status_code = np.full(len(status), -1, dtype=np.int8)
+    for name, code in STATUS_CODES.items():
+        status_code[status == name] = code
+    return SimpleNamespace(
+        rpm_mask=df['RPM'].notna().to_numpy(),
+        speed_mask=df['Speed_knots'].notna().to_numpy(),
+        status_code=status_code,
+        is_warning=status_code == STATUS_CODES['WARNING'],
+        is_attention=status_code == STATUS_CODES['ATTENTION'],
+        # (N, 4) float32 RGBA; unknown statuses are drawn green, like Normal
+        color_array=_CODE_RGBA[status_code + 1]
+    )
+
+def _dense_projection(n):
+    """Axes projection for a scatter of n points (None = regular axes)."""
+    if n > DENSE_POINTS and mpl_scatter_density is not None:
+        return 'scatter_density'
+    return None
+
+def _padded_range(values, margin, extra=()):
+    """
+    (min, max) of values and extra, widened by margin of the span on each
+    side like autoscaling does; None for an empty or single-valued range.
+    """
+    values = np.asarray(values)
+    if not len(values):
+        return None
+    lo, hi = np.nanmin(values), np.nanmax(values)
+    for value in extra:
+        lo, hi = min(lo, value), max(hi, value)
+    if not lo < hi:
+        return None
+    pad = (hi - lo) * margin
+    return lo - pad, hi + pad
+
+def _fix_limits(ax, x, y, y_extra=()):
+    """
+    Set axis limits from the data range (padded by the axes margins) and
+    turn autoscaling off, so adding artists doesn't rescan the data.
+    y_extra holds reference-line values that must stay in view. An axis
+    whose range can't be fixed is left autoscaled.
+    """
+    xmargin, ymargin = ax.margins()
+    xlim = _padded_range(x, xmargin)
+    if xlim is not None:
+        ax.set_xlim(xlim)
+        ax.set_autoscalex_on(False)
+    ylim = _padded_range(y, ymargin, y_extra)
+    if ylim is not None:
+        ax.set_ylim(ylim)
+        ax.set_autoscaley_on(False)
+
+def _subsample(x, y, keep=None, n=SUBSAMPLE_POINTS, grid=SUBSAMPLE_GRID):
+    """
+    Ascending indices of about n of the points (x, y). Points flagged in
+    keep are always returned; the others are binned on a grid x grid
+    lattice and every cell keeps at most the same number of randomly
+    chosen points, so sparse regions and outliers survive while dense
+    clusters are thinned. Seeded, so repeated runs draw the same points.
+    """
+    count = len(x)
+    keep = np.zeros(count, dtype=bool) if keep is None else np.asarray(keep, dtype=bool)
+    rest = np.flatnonzero(~keep)
+    take = max(0, n - (count - len(rest)))
+    if len(rest) <= take:
+        return np.arange(count)
+    
+    # Grid cell of every unflagged point
+    cells = np.zeros(len(rest), dtype=np.int64)
+    for values in (x, y):
+        values = np.asarray(values)
+        if values.dtype.kind == 'M':
+            values = values.astype('datetime64[ns]').astype(np.float64)
+        values = np.asarray(values, dtype=np.float64)[rest]
+        lo, hi = np.nanmin(values), np.nanmax(values)
+        scaled = np.nan_to_num((values - lo) / (hi - lo) * grid if hi > lo else values * 0)
+        cells = cells * grid + np.clip(scaled.astype(np.int64), 0, grid - 1)
+    
+    # Largest common per-cell cap that keeps at most `take` points
+    cell_counts = np.bincount(cells)
+    lo_cap, hi_cap = 0, int(cell_counts.max())
+    while lo_cap < hi_cap:
+        cap = (lo_cap + hi_cap + 1) // 2
+        if np.minimum(cell_counts, cap).sum() <= take:
+            lo_cap = cap
+        else:
+            hi_cap = cap - 1
+    
+    # Random order, grouped by cell; keep the first `cap` of every cell and
+    # fill what is left of `take` with random next-in-line points
+    rng = np.random.default_rng(0)
+    order = rng.permutation(len(rest))
+    order = order[np.argsort(cells[order], kind='stable')]
+    starts = np.concatenate(([0], np.cumsum(cell_counts)[:-1]))
+    rank = np.arange(len(rest)) - starts[cells[order]]
+    sampled = order[rank < lo_cap]
+    spare = rng.permutation(order[rank == lo_cap])[:take - len(sampled)]
+    sampled = rest[np.concatenate((sampled, spare))]
+    return np.sort(np.concatenate((np.flatnonzero(keep), sampled)))
+
+def _flagged(rgba):
+    """Mask of the rows of an RGBA color array that aren't Normal green."""
+    return (rgba != _NORMAL_RGBA).any(axis=1)
+
+def _scatter(ax, x, y, c=None, **kwargs):
+    """
+    Scatter plot that switches to a density image above DENSE_POINTS points,
+    so cost scales with the image size rather than one marker per point.
+    In dense mode non-green (ATTENTION/WARNING) points are still drawn as
+    markers on top so they stay visible; below it, more than
+    SUBSAMPLE_POINTS markers are thinned with _subsample.
+    """
+    if len(x) <= DENSE_POINTS:
+        if len(x) > SUBSAMPLE_POINTS:
+            flagged = None if c is None else _flagged(c)
+            idx = _subsample(x, y, keep=flagged)
+            x, y = np.asarray(x)[idx], np.asarray(y)[idx]
+            c = None if c is None else c[idx]
+        return ax.scatter(x, y, c=c, **kwargs)
+    
+    if hasattr(ax, 'scatter_density'):
+        # Empty pixels (count 0 < vmin) are left transparent
+        artist = ax.scatter_density(x, y, cmap=_DENSITY_CMAP, vmin=0.5, vmax=np.max)
+    else:
+        artist = ax.hexbin(x, y, gridsize=100, cmap=_DENSITY_CMAP, mincnt=1)
+    if c is not None:
+        flagged = _flagged(c)
+        if flagged.any():
+            ax.scatter(np.asarray(x)[flagged], np.asarray(y)[flagged], c=c[flagged], **kwargs)
+    return artist
+
+def _status_legend(status_code, alpha, counts=False):
+    """Legend proxy handles for the statuses present in a status_code array."""
+    code_counts = np.bincount(status_code + 1, minlength=len(_CODE_RGBA))
+    handles = []
+    for name, color in STATUS_COLORS.items():
+        count = code_counts[STATUS_CODES[name] + 1]
+        if count:
+            label = f'{name} ({count})' if counts else name
+            handles.append(Line2D([], [], marker='o', linestyle='', markersize=10,
+                                  color=color, alpha=alpha, label=label))
+    return handles
 
 def load_vibration_data(log_file="vibration_log.csv"):
     """
@@ -20,73 +251,132 @@ def load_vibration_data(log_file="vibration_log.csv"):
         print(f"❌ Log file not found: {log_file}")
         return None
     
-    # Load data
-    df = pd.read_csv(log_file)
-    
-    # Convert timestamps
-    df['Timestamp'] = pd.to_datetime(df['Timestamp'])
-    df['File_Timestamp'] = pd.to_datetime(df['File_Timestamp'], errors='coerce')
-    
-    # Convert numeric columns
-    df['RPM'] = pd.to_numeric(df['RPM'], errors='coerce')
-    df['Speed_knots'] = pd.to_numeric(df['Speed_knots'], errors='coerce')
+    if pl is not None:
+        # One multithreaded parse with typed columns, then hand off to pandas
+        df = _load_with_polars(log_file)
+    else:
+        # Load data (served from the parquet cache when it is current)
+        df = read_log(log_file)
+        
+        # Convert timestamps. Both writers emit ISO 8601 (batch rows with a
+        # space separator, live rows with 'T'), so pin the format rather than
+        # inferring it; cache=True reuses conversions of repeated values.
+        df['Timestamp'] = pd.to_datetime(df['Timestamp'], format='ISO8601', cache=True)
+        df['File_Timestamp'] = pd.to_datetime(df['File_Timestamp'], format='ISO8601',
+                                              errors='coerce', cache=True)
+        
+        # Convert numeric columns
+        df['RPM'] = pd.to_numeric(df['RPM'], errors='coerce')
+        df['Speed_knots'] = pd.to_numeric(df['Speed_knots'], errors='coerce')
     
     # Create time-based index
     df = df.sort_values('File_Timestamp')
+    df = _shrink_dtypes(df)
+    
+    # Absolute deviation, precomputed for the dashboard summary
+    df['_abs_dev'] = df['Deviation_g'].abs()
     
     return df
 
-def create_time_series_plot(df, save_path="vibration_time_series.png"):
+def _shrink_dtypes(df):
+    """
+    Downcast the loaded log so plotting moves fewer bytes: float32
+    measurements, categorical Status and Arrow-backed Notes strings.
+    """
+    for col in ('Mean_Acc_g', 'Std_Dev_g', 'Peak_Acc_g', 'Deviation_g'):
+        df[col] = df[col].astype('float32')
+    df['Status'] = df['Status'].astype('category')
+    try:
+        df['Notes'] = df['Notes'].astype('string[pyarrow]')
+    except ImportError:  # no pyarrow; use pandas' own string dtype
+        df['Notes'] = df['Notes'].astype('string')
+    return df
+
+def _load_with_polars(log_file):
+    """Parse the log with polars; same column types as the pandas path."""
+    # RPM and speed are free text in live-logged rows (e.g. "1500rpm"), so
+    # they are read as strings and non-numbers become null, like pandas'
+    # to_numeric(errors='coerce')
+    df = pl.read_csv(log_file, schema_overrides={
+        'Timestamp': pl.String,
+        'File_Timestamp': pl.String,
+        'RPM': pl.String,
+        'Speed_knots': pl.String
+    })
+    df = df.with_columns(
+        # ISO 8601 with either separator, as format='ISO8601' in the pandas path
+        pl.col('Timestamp').str.to_datetime(),
+        # Unparseable file timestamps become null (pandas errors='coerce')
+        pl.col('File_Timestamp').str.to_datetime(strict=False),
+        pl.col('RPM').cast(pl.Float64, strict=False),
+        pl.col('Speed_knots').cast(pl.Float64, strict=False)
+    )
+    return df.to_pandas()
+
+def create_time_series_plot(df, ctx=None, save_path="vibration_time_series.png"):
     """
     Create time series plot of mean acceleration over time.
     """
-    plt.figure(figsize=(15, 8))
+    if ctx is None:
+        ctx = _precompute(df)
+    
+    fig = plt.figure(figsize=(15, 8))
+    
+    timestamps = df['File_Timestamp'].to_numpy()
+    mean_acc = df['Mean_Acc_g'].to_numpy()
+    peak_acc = df['Peak_Acc_g'].to_numpy()
+    
+    colors = ctx.color_array
     
     # Plot mean acceleration over time
-    plt.subplot(2, 1, 1)
-    plt.plot(df['File_Timestamp'], df['Mean_Acc_g'], 'o-', linewidth=2, markersize=6, alpha=0.7)
+    ax1, ax2 = fig.subplots(2, 1)
+    _fix_limits(ax1, timestamps, mean_acc, y_extra=(1.01, 1.03, 1.23))
+    _fix_limits(ax2, timestamps, peak_acc)
+    
+    # Thin long logs to a readable number of markers (limits above and the
+    # legend counts still cover every reading)
+    if len(df) > SUBSAMPLE_POINTS:
+        idx = _subsample(timestamps, mean_acc, keep=_flagged(colors))
+        timestamps, mean_acc, peak_acc, colors = timestamps[idx], mean_acc[idx], peak_acc[idx], colors[idx]
+    
+    ax1.plot(timestamps, mean_acc, 'o-', linewidth=2, markersize=6, alpha=0.7)
     
     # Add baseline lines
-    plt.axhline(y=1.01, color='green', linestyle='--', alpha=0.7, label='Idle Baseline (1.01g)')
-    plt.axhline(y=1.03, color='blue', linestyle='--', alpha=0.7, label='Cruise Baseline (1.03g)')
-    plt.axhline(y=1.23, color='red', linestyle='--', alpha=0.7, label='Warning Threshold (1.23g)')
-    
-    # Color points by status
-    colors = {'Normal': 'green', 'ATTENTION': 'orange', 'WARNING': 'red'}
-    for status in colors:
-        mask = df['Status'] == status
-        if mask.any():
-            plt.scatter(df.loc[mask, 'File_Timestamp'], df.loc[mask, 'Mean_Acc_g'], 
-                       c=colors[status], s=100, alpha=0.8, label=f'{status} ({mask.sum()})')
-    
-    plt.title('🚢 Allora Yacht - Vibration Trends Over Time', fontsize=16, fontweight='bold')
-    plt.ylabel('Mean Acceleration (g)', fontsize=12)
-    plt.legend()
-    plt.grid(True, alpha=0.3)
+    ax1.axhline(y=1.01, color='green', linestyle='--', alpha=0.7, label='Idle Baseline (1.01g)')
+    ax1.axhline(y=1.03, color='blue', linestyle='--', alpha=0.7, label='Cruise Baseline (1.03g)')
+    ax1.axhline(y=1.23, color='red', linestyle='--', alpha=0.7, label='Warning Threshold (1.23g)')
+    
+    # Color points by status (one scatter call for all statuses)
+    ax1.scatter(timestamps, mean_acc, c=colors, s=100, alpha=0.8)
+    
+    ax1.set_title('🚢 Allora Yacht - Vibration Trends Over Time', fontsize=16, fontweight='bold')
+    ax1.set_ylabel('Mean Acceleration (g)', fontsize=12)
+    handles, _ = ax1.get_legend_handles_labels()
+    ax1.legend(handles=handles + _status_legend(ctx.status_code, alpha=0.8, counts=True))
+    ax1.grid(True, alpha=0.3)
     
     # Format x-axis
-    plt.xticks(rotation=45)
+    ax1.tick_params(axis='x', rotation=45)
     
     # Add peak acceleration subplot
-    plt.subplot(2, 1, 2)
-    plt.plot(df['File_Timestamp'], df['Peak_Acc_g'], 's-', linewidth=2, markersize=6, alpha=0.7, color='purple')
-    plt.title('Peak Acceleration Over Time', fontsize=14)
-    plt.ylabel('Peak Acceleration (g)', fontsize=12)
-    plt.xlabel('Date/Time', fontsize=12)
-    plt.grid(True, alpha=0.3)
-    plt.xticks(rotation=45)
-    
-    plt.tight_layout()
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
-    plt.show()
+    ax2.plot(timestamps, peak_acc, 's-', linewidth=2, markersize=6, alpha=0.7, color='purple')
+    ax2.set_title('Peak Acceleration Over Time', fontsize=14)
+    ax2.set_ylabel('Peak Acceleration (g)', fontsize=12)
+    ax2.set_xlabel('Date/Time', fontsize=12)
+    ax2.grid(True, alpha=0.3)
+    ax2.tick_params(axis='x', rotation=45)
+    
+    fig.tight_layout()
+    _save(fig, save_path)
     
     print(f"📊 Time series plot saved: {save_path}")
 
-def create_status_breakdown(df, save_path="vibration_status_breakdown.png"):
+def create_status_breakdown(df, ctx=None, save_path="vibration_status_breakdown.png"):
     """
     Create pie chart and bar chart of status breakdown.
     """
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
+    fig = plt.figure(figsize=(15, 6))
+    ax1, ax2 = fig.subplots(1, 2)
     
     # Pie chart
     status_counts = df['Status'].value_counts()
@@ -106,108 +396,113 @@ def create_status_breakdown(df, save_path="vibration_status_breakdown.png"):
         ax2.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.1, 
                 str(value), ha='center', va='bottom', fontweight='bold')
     
-    plt.tight_layout()
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
-    plt.show()
+    fig.tight_layout()
+    _save(fig, save_path)
     
     print(f"📊 Status breakdown saved: {save_path}")
 
-def create_rpm_speed_analysis(df, save_path="vibration_rpm_speed.png"):
+def create_rpm_speed_analysis(df, ctx=None, save_path="vibration_rpm_speed.png"):
     """
     Create scatter plots showing relationship between RPM, speed, and vibration.
     """
-    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
+    if ctx is None:
+        ctx = _precompute(df)
+    
+    fig = plt.figure(figsize=(15, 12))
+    (ax1, ax2), (ax3, ax4) = fig.subplots(2, 2, subplot_kw={'projection': _dense_projection(len(df))})
+    
+    # Plain numpy views; no DataFrame is built per subplot
+    rpm_mask, speed_mask = ctx.rpm_mask, ctx.speed_mask
+    rpm = df['RPM'].to_numpy()[rpm_mask]
+    speed = df['Speed_knots'].to_numpy()[speed_mask]
+    mean_acc = df['Mean_Acc_g'].to_numpy()
+    peak_acc = df['Peak_Acc_g'].to_numpy()
     
     # RPM vs Mean Acceleration
-    rpm_data = df[df['RPM'].notna()]
-    if not rpm_data.empty:
-        colors = {'Normal': 'green', 'ATTENTION': 'orange', 'WARNING': 'red'}
-        for status in colors:
-            mask = rpm_data['Status'] == status
-            if mask.any():
-                ax1.scatter(rpm_data.loc[mask, 'RPM'], rpm_data.loc[mask, 'Mean_Acc_g'], 
-                           c=colors[status], s=100, alpha=0.7, label=status)
+    if rpm_mask.any():
+        rpm_colors = ctx.color_array[rpm_mask]
+        rpm_legend = _status_legend(ctx.status_code[rpm_mask], alpha=0.7)
+        _fix_limits(ax1, rpm, mean_acc[rpm_mask])
+        _scatter(ax1, rpm, mean_acc[rpm_mask], c=rpm_colors, s=100, alpha=0.7)
         
         ax1.set_xlabel('Engine RPM')
         ax1.set_ylabel('Mean Acceleration (g)')
         ax1.set_title('RPM vs Mean Acceleration')
-        ax1.legend()
+        ax1.legend(handles=rpm_legend)
         ax1.grid(True, alpha=0.3)
     
     # Speed vs Mean Acceleration
-    speed_data = df[df['Speed_knots'].notna()]
-    if not speed_data.empty:
-        for status in colors:
-            mask = speed_data['Status'] == status
-            if mask.any():
-                ax2.scatter(speed_data.loc[mask, 'Speed_knots'], speed_data.loc[mask, 'Mean_Acc_g'], 
-                           c=colors[status], s=100, alpha=0.7, label=status)
+    if speed_mask.any():
+        speed_colors = ctx.color_array[speed_mask]
+        speed_legend = _status_legend(ctx.status_code[speed_mask], alpha=0.7)
+        _fix_limits(ax2, speed, mean_acc[speed_mask])
+        _scatter(ax2, speed, mean_acc[speed_mask], c=speed_colors, s=100, alpha=0.7)
         
         ax2.set_xlabel('Speed (knots)')
         ax2.set_ylabel('Mean Acceleration (g)')
         ax2.set_title('Speed vs Mean Acceleration')
-        ax2.legend()
+        ax2.legend(handles=speed_legend)
         ax2.grid(True, alpha=0.3)
     
     # RPM vs Peak Acceleration
-    if not rpm_data.empty:
-        for status in colors:
-            mask = rpm_data['Status'] == status
-            if mask.any():
-                ax3.scatter(rpm_data.loc[mask, 'RPM'], rpm_data.loc[mask, 'Peak_Acc_g'], 
-                           c=colors[status], s=100, alpha=0.7, label=status)
+    if rpm_mask.any():
+        _fix_limits(ax3, rpm, peak_acc[rpm_mask])
+        _scatter(ax3, rpm, peak_acc[rpm_mask], c=rpm_colors, s=100, alpha=0.7)
         
         ax3.set_xlabel('Engine RPM')
         ax3.set_ylabel('Peak Acceleration (g)')
         ax3.set_title('RPM vs Peak Acceleration')
-        ax3.legend()
+        ax3.legend(handles=rpm_legend)
         ax3.grid(True, alpha=0.3)
     
     # Speed vs Peak Acceleration
-    if not speed_data.empty:
-        for status in colors:
-            mask = speed_data['Status'] == status
-            if mask.any():
-                ax4.scatter(speed_data.loc[mask, 'Speed_knots'], speed_data.loc[mask, 'Peak_Acc_g'], 
-                           c=colors[status], s=100, alpha=0.7, label=status)
+    if speed_mask.any():
+        _fix_limits(ax4, speed, peak_acc[speed_mask])
+        _scatter(ax4, speed, peak_acc[speed_mask], c=speed_colors, s=100, alpha=0.7)
         
         ax4.set_xlabel('Speed (knots)')
         ax4.set_ylabel('Peak Acceleration (g)')
         ax4.set_title('Speed vs Peak Acceleration')
-        ax4.legend()
+        ax4.legend(handles=speed_legend)
         ax4.grid(True, alpha=0.3)
     
-    plt.tight_layout()
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
-    plt.show()
+    fig.tight_layout()
+    _save(fig, save_path)
     
     print(f"📊 RPM/Speed analysis saved: {save_path}")
 
-def create_location_analysis(df, save_path="vibration_location_analysis.png"):
+def create_location_analysis(df, ctx=None, save_path="vibration_location_analysis.png"):
     """
     Create analysis based on location/notes in filenames.
     """
+    if ctx is None:
+        ctx = _precompute(df)
+    
     # Extract location from notes
-    df['Location'] = df['Notes'].str.extract(r'(stern|salon|deck|coffee table|shaft)', flags=re.IGNORECASE)
-    df['Location'] = df['Location'].fillna('other')
+    location = df['Notes'].str.extract(_LOC_RE, expand=False).fillna('other').str.lower()
+    df['Location'] = pd.Categorical(location, categories=LOCATIONS)
     
-    # Group by location
-    location_stats = df.groupby('Location').agg({
+    # Group by location (only locations that actually occur); warnings are
+    # counted by summing a precomputed flag so every aggregation is built-in
+    is_warn = ctx.is_warning.astype(np.int8)
+    location_stats = df.assign(_is_warn=is_warn).groupby('Location', observed=True).agg({
         'Mean_Acc_g': ['mean', 'std', 'count'],
         'Peak_Acc_g': ['mean', 'max'],
-        'Status': lambda x: (x == 'WARNING').sum()
+        '_is_warn': 'sum'
     }).round(3)
     
     # Flatten column names
     location_stats.columns = ['_'.join(col).strip() for col in location_stats.columns]
+    location_stats = location_stats.rename(columns={'_is_warn_sum': 'Status_warnings'})
     
     # Create visualization
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
+    fig = plt.figure(figsize=(15, 6))
+    ax1, ax2 = fig.subplots(1, 2)
     
     # Mean acceleration by location
     locations = location_stats.index
     means = location_stats['Mean_Acc_g_mean']
-    colors = ['red' if location_stats.loc[loc, 'Status_<lambda>'] > 0 else 'green' for loc in locations]
+    colors = ['red' if location_stats.loc[loc, 'Status_warnings'] > 0 else 'green' for loc in locations]
     
     bars1 = ax1.bar(locations, means, color=colors, alpha=0.7)
     ax1.set_title('Mean Acceleration by Location', fontsize=14, fontweight='bold')
@@ -231,9 +526,8 @@ def create_location_analysis(df, save_path="vibration_location_analysis.png"):
         ax2.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.05, 
                 f'{value:.3f}', ha='center', va='bottom', fontweight='bold')
     
-    plt.tight_layout()
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
-    plt.show()
+    fig.tight_layout()
+    _save(fig, save_path)
     
     print(f"📊 Location analysis saved: {save_path}")
     
@@ -242,18 +536,28 @@ def create_location_analysis(df, save_path="vibration_location_analysis.png"):
     print("=" * 50)
     print(location_stats.to_string())
 
-def create_summary_dashboard(df, save_path="vibration_dashboard.png"):
+def create_summary_dashboard(df, ctx=None, save_path="vibration_dashboard.png"):
     """
     Create a comprehensive dashboard with key metrics.
     """
+    if ctx is None:
+        ctx = _precompute(df)
+    
     fig = plt.figure(figsize=(20, 12))
+    projection = _dense_projection(len(df))
     
     # Set up the grid
     gs = fig.add_gridspec(3, 4, hspace=0.3, wspace=0.3)
     
     # 1. Time series (top row, spans 3 columns)
     ax1 = fig.add_subplot(gs[0, :3])
-    ax1.plot(df['File_Timestamp'], df['Mean_Acc_g'], 'o-', linewidth=2, markersize=6, alpha=0.7)
+    timestamps = df['File_Timestamp'].to_numpy()
+    mean_acc = df['Mean_Acc_g'].to_numpy()
+    _fix_limits(ax1, timestamps, mean_acc, y_extra=(1.01, 1.03))
+    if len(df) > SUBSAMPLE_POINTS:
+        idx = _subsample(timestamps, mean_acc, keep=_flagged(ctx.color_array))
+        timestamps, mean_acc = timestamps[idx], mean_acc[idx]
+    ax1.plot(timestamps, mean_acc, 'o-', linewidth=2, markersize=6, alpha=0.7)
     ax1.axhline(y=1.01, color='green', linestyle='--', alpha=0.7, label='Idle Baseline')
     ax1.axhline(y=1.03, color='blue', linestyle='--', alpha=0.7, label='Cruise Baseline')
     ax1.set_title('Vibration Trends Over Time', fontsize=14, fontweight='bold')
@@ -271,28 +575,31 @@ def create_summary_dashboard(df, save_path="vibration_dashboard.png"):
     ax2.set_title('Status Distribution', fontsize=12, fontweight='bold')
     
     # 3. RPM vs Vibration (middle left)
-    ax3 = fig.add_subplot(gs[1, 0])
-    rpm_data = df[df['RPM'].notna()]
+    ax3 = fig.add_subplot(gs[1, 0], projection=projection)
+    rpm_data = df[ctx.rpm_mask]
     if not rpm_data.empty:
-        ax3.scatter(rpm_data['RPM'], rpm_data['Mean_Acc_g'], alpha=0.7)
+        _fix_limits(ax3, rpm_data['RPM'].to_numpy(), rpm_data['Mean_Acc_g'].to_numpy())
+        _scatter(ax3, rpm_data['RPM'], rpm_data['Mean_Acc_g'], alpha=0.7)
         ax3.set_xlabel('Engine RPM')
         ax3.set_ylabel('Mean Acceleration (g)')
         ax3.set_title('RPM vs Vibration')
         ax3.grid(True, alpha=0.3)
     
     # 4. Speed vs Vibration (middle center)
-    ax4 = fig.add_subplot(gs[1, 1])
-    speed_data = df[df['Speed_knots'].notna()]
+    ax4 = fig.add_subplot(gs[1, 1], projection=projection)
+    speed_data = df[ctx.speed_mask]
     if not speed_data.empty:
-        ax4.scatter(speed_data['Speed_knots'], speed_data['Mean_Acc_g'], alpha=0.7)
+        _fix_limits(ax4, speed_data['Speed_knots'].to_numpy(), speed_data['Mean_Acc_g'].to_numpy())
+        _scatter(ax4, speed_data['Speed_knots'], speed_data['Mean_Acc_g'], alpha=0.7)
         ax4.set_xlabel('Speed (knots)')
         ax4.set_ylabel('Mean Acceleration (g)')
         ax4.set_title('Speed vs Vibration')
         ax4.grid(True, alpha=0.3)
     
     # 5. Peak vs Mean (middle right)
-    ax5 = fig.add_subplot(gs[1, 2])
-    ax5.scatter(df['Mean_Acc_g'], df['Peak_Acc_g'], alpha=0.7)
+    ax5 = fig.add_subplot(gs[1, 2], projection=projection)
+    _fix_limits(ax5, df['Mean_Acc_g'].to_numpy(), df['Peak_Acc_g'].to_numpy())
+    _scatter(ax5, df['Mean_Acc_g'], df['Peak_Acc_g'], alpha=0.7)
     ax5.set_xlabel('Mean Acceleration (g)')
     ax5.set_ylabel('Peak Acceleration (g)')
     ax5.set_title('Peak vs Mean Acceleration')
@@ -300,15 +607,17 @@ def create_summary_dashboard(df, save_path="vibration_dashboard.png"):
     
     # 6. Deviation histogram (bottom left)
     ax6 = fig.add_subplot(gs[2, 0])
-    ax6.hist(df['Deviation_g'], bins=10, alpha=0.7, color='skyblue', edgecolor='black')
+    deviation = df['Deviation_g'].dropna().to_numpy()
+    ax6.hist(deviation, bins=np.histogram_bin_edges(deviation, bins=10), alpha=0.7, color='skyblue', edgecolor='black')
     ax6.set_xlabel('Deviation from Baseline (g)')
     ax6.set_ylabel('Frequency')
     ax6.set_title('Deviation Distribution')
     ax6.grid(True, alpha=0.3)
     
     # 7. Standard deviation vs mean (bottom center)
-    ax7 = fig.add_subplot(gs[2, 1])
-    ax7.scatter(df['Mean_Acc_g'], df['Std_Dev_g'], alpha=0.7)
+    ax7 = fig.add_subplot(gs[2, 1], projection=projection)
+    _fix_limits(ax7, df['Mean_Acc_g'].to_numpy(), df['Std_Dev_g'].to_numpy())
+    _scatter(ax7, df['Mean_Acc_g'], df['Std_Dev_g'], alpha=0.7)
     ax7.set_xlabel('Mean Acceleration (g)')
     ax7.set_ylabel('Standard Deviation (g)')
     ax7.set_title('Variability vs Mean')
@@ -319,14 +628,25 @@ def create_summary_dashboard(df, save_path="vibration_dashboard.png"):
     ax8.axis('off')
     
     # Calculate summary statistics
+    # (status counts are shared with the pie chart; the rest is one agg call)
     total_readings = len(df)
-    normal_count = (df['Status'] == 'Normal').sum()
-    warning_count = (df['Status'] == 'WARNING').sum()
-    attention_count = (df['Status'] == 'ATTENTION').sum()
-    
-    mean_acc_avg = df['Mean_Acc_g'].mean()
-    peak_acc_max = df['Peak_Acc_g'].max()
-    deviation_avg = df['Deviation_g'].abs().mean()
+    normal_count = status_counts.get('Normal', 0)
+    warning_count = status_counts.get('WARNING', 0)
+    attention_count = status_counts.get('ATTENTION', 0)
+    
+    if '_abs_dev' not in df:
+        df = df.assign(_abs_dev=df['Deviation_g'].abs())
+    stats = df.agg({
+        'Mean_Acc_g': 'mean',
+        'Peak_Acc_g': 'max',
+        '_abs_dev': 'mean',
+        'File_Timestamp': ['min', 'max']
+    })
+    mean_acc_avg = stats.at['mean', 'Mean_Acc_g']
+    peak_acc_max = stats.at['max', 'Peak_Acc_g']
+    deviation_avg = stats.at['mean', '_abs_dev']
+    first_date = stats.at['min', 'File_Timestamp']
+    last_date = stats.at['max', 'File_Timestamp']
     
     summary_text = f"""
     📊 VIBRATION ANALYSIS SUMMARY
@@ -340,19 +660,71 @@ def create_summary_dashboard(df, save_path="vibration_dashboard.png"):
     Maximum Peak Acceleration: {peak_acc_max:.3f} g
     Average Deviation: {deviation_avg:.3f} g
     
-    Date Range: {df['File_Timestamp'].min().strftime('%Y-%m-%d')} to {df['File_Timestamp'].max().strftime('%Y-%m-%d')}
+    Date Range: {first_date.strftime('%Y-%m-%d')} to {last_date.strftime('%Y-%m-%d')}
     """
     
     ax8.text(0.05, 0.95, summary_text, transform=ax8.transAxes, fontsize=12,
              verticalalignment='top', fontfamily='monospace',
              bbox=dict(boxstyle="round,pad=0.5", facecolor="lightgray", alpha=0.8))
     
-    plt.suptitle('🚢 Allora Yacht - Vibration Analysis Dashboard', fontsize=16, fontweight='bold')
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
-    plt.show()
+    fig.suptitle('🚢 Allora Yacht - Vibration Analysis Dashboard', fontsize=16, fontweight='bold')
+    _save(fig, save_path, dpi=DASHBOARD_DPI)
     
     print(f"📊 Dashboard saved: {save_path}")
 
+# Plot name -> function, rendered in parallel by main()
+_PLOTTERS = {
+    'time_series': create_time_series_plot,
+    'status': create_status_breakdown,
+    'rpm_speed': create_rpm_speed_analysis,
+    'location': create_location_analysis,
+    'dashboard': create_summary_dashboard
+}
+
+# Per-worker copies of the DataFrame and its precomputed masks
+_WORKER_DF = None
+_WORKER_CTX = None
+
+def _init_plot_worker(df_path):
+    """Load the shared DataFrame and its masks once per worker process and set the style."""
+    global _WORKER_DF, _WORKER_CTX
+    plt.switch_backend('Agg')
+    plt.style.use('default')
+    plt.rcParams['axes.prop_cycle'] = plt.cycler(color=HUSL_PALETTE)
+    _WORKER_DF, _WORKER_CTX = pd.read_pickle(df_path)
+
+def _run_plot(name):
+    """Render one named plot in a worker process."""
+    _PLOTTERS[name](_WORKER_DF, _WORKER_CTX)
+
+def _plot_cache_key(log_file):
+    """
+    Hash of the log contents plus this script, so cached plots are reused
+    only while neither the data nor the plotting code has changed.
+    """
+    h = xxhash.xxh64() if xxhash is not None else hashlib.blake2b(digest_size=8)
+    for path in (log_file, __file__):
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                h.update(block)
+    return h.hexdigest()
+
+def _restore_cached_plots(cache_dir):
+    """Copy cached plots to the working directory; False if any is missing."""
+    if not all(os.path.exists(os.path.join(cache_dir, name)) for name in PLOT_FILES):
+        return False
+    for name in PLOT_FILES:
+        shutil.copyfile(os.path.join(cache_dir, name), name)
+    return True
+
+def _store_cached_plots(cache_dir):
+    """Save the freshly generated plots as the only cache entry."""
+    if os.path.isdir(PLOT_CACHE_DIR):
+        shutil.rmtree(PLOT_CACHE_DIR)
+    os.makedirs(cache_dir)
+    for name in PLOT_FILES:
+        shutil.copyfile(name, os.path.join(cache_dir, name))
+
 def main():
     """
     Main function to create all visualizations.
@@ -360,8 +732,21 @@ def main():
     print("🚢 Allora Yacht - Vibration Data Visualization")
     print("=" * 50)
     
+    # Skip everything when the log hasn't changed since the last run
+    log_file = "vibration_log.csv"
+    cache_dir = None
+    if os.path.exists(log_file):
+        cache_dir = os.path.join(PLOT_CACHE_DIR, _plot_cache_key(log_file))
+        if _restore_cached_plots(cache_dir):
+            print("♻️  Log unchanged since last run - reused cached plots:")
+            for name in PLOT_FILES:
+                print(f"  - {name}")
+            if '--show' in sys.argv:
+                _show_plots()
+            return
+    
     # Load data
-    df = load_vibration_data()
+    df = load_vibration_data(log_file)
     if df is None:
         return
     
@@ -369,25 +754,28 @@ def main():
     print(f"📅 Date range: {df['File_Timestamp'].min().strftime('%Y-%m-%d')} to {df['File_Timestamp'].max().strftime('%Y-%m-%d')}")
     print()
     
-    # Set style
-    plt.style.use('default')
-    sns.set_palette("husl")
-    
-    # Create all visualizations
+    # Create all visualizations, one worker process per plot. The DataFrame
+    # and its masks (computed once, here) are serialized once to a temp
+    # file rather than pickled for every task.
     try:
-        create_time_series_plot(df)
-        create_status_breakdown(df)
-        create_rpm_speed_analysis(df)
-        create_location_analysis(df)
-        create_summary_dashboard(df)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            df_path = os.path.join(tmp_dir, 'vibration_data.pkl')
+            pd.to_pickle((df, _precompute(df)), df_path)
+            with ProcessPoolExecutor(max_workers=len(_PLOTTERS), initializer=_init_plot_worker,
+                                     initargs=(df_path,)) as pool:
+                futures = [pool.submit(_run_plot, name) for name in _PLOTTERS]
+                for future in futures:
+                    future.result()
+        
+        _store_cached_plots(cache_dir)
         
         print("\n✅ All visualizations completed!")
         print("📊 Generated files:")
-        print("  - vibration_time_series.png")
-        print("  - vibration_status_breakdown.png")
-        print("  - vibration_rpm_speed.png")
-        print("  - vibration_location_analysis.png")
-        print("  - vibration_dashboard.png")
+        for name in PLOT_FILES:
+            print(f"  - {name}")
+        
+        if '--show' in sys.argv:
+            _show_plots()
         
     except Exception as e:
         print(f"❌ Error creating visualizations: {e}")
@@ -7,13 +7,35 @@ Live WT901BLE68 Vibration Monitor (Bluetooth LE)
 """
 
 import asyncio
+import collections
+from math import hypot
 import numpy as np
 from bleak import BleakScanner, BleakClient
 import struct
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to the numpy frame search
+    njit = None
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional; fall back to the default asyncio loop
+    uvloop = None
+
 # WT901BLE68 BLE notify characteristic UUID (usually this for WitMotion BLE)
 WT901_NOTIFY_UUID = "0000ffe4-0000-1000-8000-00805f9a34fb"
 
+# Parsed (ax, ay, az) readings waiting to be printed. Bounded, so if the
+# terminal can't keep up the oldest readings are dropped instead of piling up.
+BUF = collections.deque(maxlen=4096)
+PRINT_INTERVAL = 0.05  # seconds between printed batches (20 Hz)
+
+# WT901 acceleration frame layout and scaling (raw int16 counts -> g)
+FRAME_LEN = 11
+SCALE = 16.0 / 32768.0  # a power of two, so scaling is exact
+_ACC = struct.Struct('<3h')
+
 # Helper: scan for BLE devices and let user pick
 async def pick_device():
     print("Scanning for BLE devices (WT901)...")
@@ -23,28 +45,90 @@ async def pick_device():
     idx = int(input("Select device number: "))
     return devices[idx].address
 
+# Helper: locate WT901 acceleration frames (0x55 0x51 ...) in a notification
+def find_acc_frames(data):
+    # Each frame: 11 bytes, 0x55 0x51 axL axH ayL ayH azL azH tempL tempH sum
+    # Data may be streamed as a sequence of such frames, so all header
+    # positions are found in one vectorized pass over the bytes
+    buf = np.frombuffer(data, dtype=np.uint8)
+    starts = np.flatnonzero((buf[:-1] == 0x55) & (buf[1:] == 0x51))
+    frames = []
+    next_free = 0
+    for start in starts.tolist():
+        if start > len(data) - FRAME_LEN:
+            break
+        # Skip header-like byte pairs inside a frame already taken
+        if start >= next_free:
+            frames.append(start)
+            next_free = start + FRAME_LEN
+    return frames
+
+# Compiled scanner: decode every frame in one pass over the bytes (numba only)
+if njit is not None:
+    @njit(cache=True)
+    def _scan_frames(buf, out):
+        n = 0
+        i = 0
+        while i <= buf.size - FRAME_LEN:
+            if buf[i] == 0x55 and buf[i + 1] == 0x51:
+                for k in range(3):
+                    raw = np.int32(buf[i + 2 + 2 * k]) | (np.int32(buf[i + 3 + 2 * k]) << 8)
+                    if raw >= 32768:
+                        raw -= 65536
+                    out[n, k] = raw * SCALE
+                n += 1
+                i += FRAME_LEN  # header-like bytes inside a frame are skipped
+            else:
+                i += 1
+        return n
+    
+    # Compile (or load from cache) now rather than on the first notification
+    _scan_frames(np.zeros(FRAME_LEN, dtype=np.uint8), np.empty((1, 3)))
+
+# Helper: parse every acceleration frame in a notification as (ax, ay, az) in g
+def parse_wt901_frames(data):
+    # Fast path: notification is a single frame starting at offset 0
+    if FRAME_LEN <= len(data) < 2 * FRAME_LEN and data[0] == 0x55 and data[1] == 0x51:
+        ax, ay, az = _ACC.unpack_from(data, 2)
+        return [(ax * SCALE, ay * SCALE, az * SCALE)]
+    if njit is not None:
+        out = np.empty((len(data) // FRAME_LEN, 3))
+        n = _scan_frames(np.frombuffer(data, dtype=np.uint8), out)
+        return list(map(tuple, out[:n].tolist()))
+    readings = []
+    for start in find_acc_frames(data):
+        ax, ay, az = _ACC.unpack_from(data, start + 2)
+        readings.append((ax * SCALE, ay * SCALE, az * SCALE))
+    return readings
+
 # Helper: parse WT901 data frame for AccX, AccY, AccZ (see WT901 protocol)
 def parse_wt901_acc(data):
-    # WT901 sends 0x55 0x51 ... for acceleration frame (see manual)
-    # Each frame: 11 bytes, 0x55 0x51 axL axH ayL ayH azL azH tempL tempH sum
-    # Data may be streamed as a sequence of such frames
-    # We'll look for 0x55 0x51 and parse the next 8 bytes
-    for i in range(len(data) - 10):
-        if data[i] == 0x55 and data[i+1] == 0x51:
-            ax = struct.unpack('<h', data[i+2:i+4])[0] / 32768 * 16  # g
-            ay = struct.unpack('<h', data[i+4:i+6])[0] / 32768 * 16
-            az = struct.unpack('<h', data[i+6:i+8])[0] / 32768 * 16
-            return ax, ay, az
+    # First acceleration frame in the notification (None if there is none)
+    readings = parse_wt901_frames(data)
+    if readings:
+        return readings[0]
     return None, None, None
 
-# Notification handler
+# Notification handler: only parse and buffer, printing happens in drain()
 def handle_notify(sender, data):
-    ax, ay, az = parse_wt901_acc(data)
-    if ax is not None:
-        acc_total = np.sqrt(ax**2 + ay**2 + az**2)
-        print(f"AccX: {ax:.3f}g  AccY: {ay:.3f}g  AccZ: {az:.3f}g  |  Acc_total: {acc_total:.3f}g")
+    # Every frame in the packet is kept, not just the first
+    BUF.extend(parse_wt901_frames(data))
     # else: print("No valid acc frame in packet")
 
+# Consumer: format and print buffered readings in one write per batch
+async def drain():
+    while True:
+        await asyncio.sleep(PRINT_INTERVAL)
+        if not BUF:
+            continue
+        lines = []
+        for _ in range(len(BUF)):
+            ax, ay, az = BUF.popleft()
+            # Scalar C math; np.sqrt on Python floats pays numpy dispatch per call
+            acc_total = hypot(ax, ay, az)
+            lines.append(f"AccX: {ax:.3f}g  AccY: {ay:.3f}g  AccZ: {az:.3f}g  |  Acc_total: {acc_total:.3f}g")
+        print("\n".join(lines))
+
 async def main():
     print("=== WT901BLE68 Live Vibration Monitor ===")
     mac = input("Enter WT901BLE68 MAC address (or leave blank to scan): ").strip()
@@ -53,6 +137,7 @@ async def main():
     print(f"Connecting to {mac} ...")
     async with BleakClient(mac) as client:
         print("Connected! Subscribing to notifications...")
+        printer = asyncio.create_task(drain())
         await client.start_notify(WT901_NOTIFY_UUID, handle_notify)
         print("Streaming live data. Press Ctrl+C to stop.")
         try:
@@ -61,6 +146,10 @@ async def main():
         except KeyboardInterrupt:
             print("\nStopped.")
         await client.stop_notify(WT901_NOTIFY_UUID)
+        printer.cancel()
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main()) 
\ No newline at end of file
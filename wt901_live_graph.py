@@ -5,30 +5,42 @@ Connects to WT901BLE68 sensor and displays live vibration data with baseline com
 """
 
 import asyncio
-import struct
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
 import matplotlib.dates as mdates
-from datetime import datetime, timedelta
 from bleak import BleakScanner, BleakClient
 import warnings
 from matplotlib.widgets import Button
 import tkinter as tk
-from tkinter import simpledialog
+from tkinter import ttk
 import argparse
+import math
+import time
 import sys
 import os
-from collections import deque
-import queue
 warnings.filterwarnings('ignore')
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to the Python frame splitter
+    njit = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # pyarrow is optional; fall back to the pandas parser
+    pa = None
+
 # WT901BLE68 BLE characteristics
 WT901_SERVICE_UUID = "0000ffe5-0000-1000-8000-00805f9a34fb"
 WT901_CHAR_UUID = "0000ffe4-0000-1000-8000-00805f9a34fb"
 WT901_WRITE_CHAR_UUID = "0000ffe9-0000-1000-8000-00805f9a34fb"
 
+# Historical readings (written by cmd/calcvib.py) shown for comparison
+BASELINE_LOG = 'cmd/vibration_log.csv'
+
 # Default device MAC address for Allora yacht
 DEFAULT_DEVICE_MAC = "CC726E53-F6B5-6245-D962-948F091FCBFA"
 
@@ -37,12 +49,103 @@ IDLE_BASELINE = 1.01  # g
 CRUISE_BASELINE = 1.03  # g
 WARNING_THRESHOLD = 0.2  # g increase from baseline
 
+# Raw int16 counts to g (+/-16 g full scale)
+ACC_SCALE = 16.0 / 32768.0
+
+# Recent readings are kept in a fixed-size ring buffer with one contiguous
+# column per RING_DTYPE field; batches travel between threads as records
+# (t is time.monotonic_ns() at reception)
+RING_SIZE = 1000
+RING_DTYPE = np.dtype([('t', 'i8'), ('x', 'f4'), ('y', 'f4'), ('z', 'f4'), ('tot_sq', 'f4')])
+
+# Readings decoded by the parser wait for the next redraw in a preallocated
+# RING_DTYPE record ring of this size
+INBOX_SIZE = 4096
+
+# Raw notifications waiting for the parser; beyond this they are dropped
+RAW_QUEUE_SIZE = 1024
+
+# Frame length by two-byte header: standard WT901 IMU frame (0x55 0x51) and
+# custom WT901BLE68 format (0x55 0x61)
+FRAME_SPECS = {b'\x55\x51': 11, b'\x55\x61': 16}
+# The same, by the header's second byte (after 0x55)
+FRAME_LENGTHS = {header[1]: length for header, length in FRAME_SPECS.items()}
+
+# Compiled frame splitters (numba only). split_and_parse walks the
+# notification bytes once, decoding every 0x51 (11 byte) and 0x61 (16 byte)
+# frame into a row of out as (x, y, z, total squared) in g, and returns the number
+# of frames found. split_fixed is the specialized version used once the
+# session's frame format is known: frames back to back at a fixed stride,
+# no header search; it returns -1 if a slot doesn't start with the header.
+if njit is not None:
+    @njit(cache=True, fastmath=True, nogil=True)
+    def _decode_frame(buf, i, out, n):
+        total_sq = np.float32(0.0)
+        for k in range(3):
+            raw = np.int32(buf[i + 2 + 2 * k]) | (np.int32(buf[i + 3 + 2 * k]) << 8)
+            if raw >= 32768:
+                raw -= 65536
+            value = np.float32(raw * ACC_SCALE)
+            out[n, k] = value
+            total_sq += value * value
+        out[n, 3] = total_sq
+    
+    @njit(cache=True, fastmath=True, nogil=True)
+    def split_and_parse(buf, out):
+        n = 0
+        i = 0
+        size = buf.size
+        while i < size - 1:
+            if buf[i] == 0x55 and buf[i + 1] == 0x51 and i + 11 <= size:
+                frame_len = 11
+            elif buf[i] == 0x55 and buf[i + 1] == 0x61 and i + 16 <= size:
+                frame_len = 16
+            else:
+                i += 1
+                continue
+            _decode_frame(buf, i, out, n)
+            n += 1
+            i += frame_len
+        return n
+    
+    @njit(cache=True, fastmath=True, nogil=True)
+    def split_fixed(buf, out, header, frame_len):
+        n = buf.size // frame_len
+        for f in range(n):
+            i = f * frame_len
+            if buf[i] != 0x55 or buf[i + 1] != header:
+                return -1
+            _decode_frame(buf, i, out, f)
+        return n
+    
+    # Compile (or load from cache) now rather than on the first notification
+    split_and_parse(np.zeros(16, dtype=np.uint8), np.empty((1, 4), dtype=np.float32))
+    split_fixed(np.zeros(16, dtype=np.uint8), np.empty((1, 4), dtype=np.float32), 0x61, 16)
+
 class LiveVibrationMonitor:
+    SCALE = ACC_SCALE
+    
     def __init__(self):
-        self.acc_data = deque(maxlen=1000)  # Thread-safe with max length
-        self.timestamps = deque(maxlen=1000)
-        self.acc_total = deque(maxlen=1000)
-        self.data_queue = queue.Queue()  # Thread-safe queue for new data
+        # Ring buffer of recent readings (structure of arrays): write cursor
+        # _head, fill count _n, and the squared total column hoisted for
+        # update_plot (the magnitude's sqrt is only taken for plotted windows)
+        self._ring = {name: np.zeros(RING_SIZE, dtype=RING_DTYPE[name]) for name in RING_DTYPE.names}
+        self._head = 0
+        self._n = 0
+        self._tot_sq = self._ring['tot_sq']
+        self._x_data = np.arange(100)  # x values of the plotted windows, sliced per redraw
+        # Raw (bytes, timestamp) notifications, parsed off the loop by _parser
+        self._raw_q = asyncio.Queue(maxsize=RAW_QUEUE_SIZE)
+        self._parser_task = None
+        self._dropped = 0
+        # New readings: single-producer/single-consumer record ring shared by
+        # _parse_into_ring (writes, then advances _wpos) and update_plot (reads up
+        # to _wpos, then advances _rpos). Both positions only ever grow and are
+        # plain ints, so no lock is needed; if drawing stalls for more than
+        # INBOX_SIZE readings the oldest are overwritten.
+        self._inbox = np.zeros(INBOX_SIZE, dtype=RING_DTYPE)
+        self._wpos = 0
+        self._rpos = 0
         self.baseline_data = None
         self.fig, self.axes = None, None
         self.lines = {}
@@ -54,15 +157,31 @@ class LiveVibrationMonitor:
         self.change_device_button = None
         self.ani = None
         self.root = None
+        self._loop = None  # asyncio loop running main(), set there
         self.packet_count = 0
+        self._frames = np.empty((64, 4), dtype=np.float32)  # compiled splitter scratch
+        self._frame_len = None  # session frame format, detected from the first frame
+        self._header = None
+        self._last_status = None  # connection state at the last redraw
+        self._notification_count = 0
         
     def load_baseline_data(self):
         """Load historical vibration data for comparison"""
         try:
-            if pd.io.common.file_exists('cmd/vibration_log.csv'):
-                df = pd.read_csv('cmd/vibration_log.csv')
-                df['timestamp'] = pd.to_datetime(df['Timestamp'])
-                df['mean_acc'] = df['Mean Acc (g)']
+            if os.path.exists(BASELINE_LOG):
+                if pa is not None:
+                    # Parse only the two plotted columns, already typed
+                    table = pacsv.read_csv(BASELINE_LOG, convert_options=pacsv.ConvertOptions(
+                        include_columns=['Timestamp', 'Mean Acc (g)'],
+                        column_types={'Timestamp': pa.timestamp('us'), 'Mean Acc (g)': pa.float64()}))
+                    df = pd.DataFrame({
+                        'timestamp': table['Timestamp'].to_pandas(),
+                        'mean_acc': table['Mean Acc (g)'].to_numpy()
+                    })
+                else:
+                    df = pd.read_csv(BASELINE_LOG, usecols=['Timestamp', 'Mean Acc (g)'],
+                                     parse_dates=['Timestamp'], engine='c')
+                    df = df.rename(columns={'Timestamp': 'timestamp', 'Mean Acc (g)': 'mean_acc'})
                 self.baseline_data = df
                 print(f"Loaded {len(df)} historical readings", flush=True)
             else:
@@ -143,48 +262,53 @@ class LiveVibrationMonitor:
     def parse_wt901_data(self, data):
         """Parse WT901BLE68 acceleration data from BLE packet - supports both 0x51 and 0x61 formats"""
         try:
-            if len(data) >= 11 and data[0] == 0x55 and data[1] == 0x51:
-                # Standard WT901 IMU frame (11 bytes)
-                acc_x = struct.unpack('<h', data[2:4])[0] / 32768.0 * 16  # Convert to g
-                acc_y = struct.unpack('<h', data[4:6])[0] / 32768.0 * 16
-                acc_z = struct.unpack('<h', data[6:8])[0] / 32768.0 * 16
-                
-            elif len(data) >= 16 and data[0] == 0x55 and data[1] == 0x61:
-                # Custom WT901BLE68 format (16 bytes) - acceleration in positions 2-7
-                acc_x = struct.unpack('<h', data[2:4])[0] / 32768.0 * 16
-                acc_y = struct.unpack('<h', data[4:6])[0] / 32768.0 * 16
-                acc_z = struct.unpack('<h', data[6:8])[0] / 32768.0 * 16
-                
-            else:
+            # Standard WT901 IMU frame (11 bytes) or custom WT901BLE68 format
+            # (16 bytes) - both carry acceleration in positions 2-7
+            frame_len = FRAME_SPECS.get(bytes(data[:2]))
+            if frame_len is None or len(data) < frame_len:
                 return None, None, None, None
             
-            # Calculate total acceleration
-            acc_total = np.sqrt(acc_x**2 + acc_y**2 + acc_z**2)
+            # View the first 8 bytes as four int16 (header word + the three
+            # axes, little-endian like the host) without copying, convert to g
+            words = memoryview(data)[:8].cast('h')
+            acc_x = words[1] * self.SCALE
+            acc_y = words[2] * self.SCALE
+            acc_z = words[3] * self.SCALE
+            
+            # Squared total acceleration; the sqrt is left to whoever shows it
+            acc_sq = acc_x * acc_x + acc_y * acc_y + acc_z * acc_z
             
-            return acc_x, acc_y, acc_z, acc_total
+            return acc_x, acc_y, acc_z, acc_sq
         except Exception as e:
             print(f"Error parsing data: {e}", flush=True)
         return None, None, None, None
     
     def update_plot(self, frame):
         """Update the real-time plots"""
-        # Consume data from queue and add to deques
-        queue_size = self.data_queue.qsize()
-        if queue_size > 0:
-            print(f"Consuming {queue_size} items from queue", flush=True)
-        
-        while not self.data_queue.empty():
-            try:
-                data = self.data_queue.get_nowait()
-                self.timestamps.append(data['timestamp'])
-                self.acc_data.append(data['acc_data'])
-                self.acc_total.append(data['acc_total'])
-            except queue.Empty:
-                break
+        # Consume new readings from the inbox into the ring buffer. Only those
+        # written before _wpos was read are taken; later ones wait a frame.
+        wpos = self._wpos
+        rpos = max(self._rpos, wpos - INBOX_SIZE)
+        count = wpos - rpos
+        if count:
+            start = rpos % INBOX_SIZE
+            if start + count <= INBOX_SIZE:
+                records = self._inbox[start:start + count]
+            else:
+                records = np.concatenate((self._inbox[start:], self._inbox[:start + count - INBOX_SIZE]))
+            print(f"Consuming {count} items from queue", flush=True)
+            self._extend(records)
+        self._rpos = wpos
         
         # Debug: Print data status
         if frame % 10 == 0:  # Print every 10th frame to avoid spam
-            print(f"Update frame {frame}: {len(self.timestamps)} timestamps, {len(self.acc_total)} acc values, {self.packet_count} packets", flush=True)
+            print(f"Update frame {frame}: {self._n} timestamps, {self._n} acc values, {self.packet_count} packets", flush=True)
+        
+        # Nothing to redraw without new samples or a connection change
+        status = (self.is_connected, self.disconnect_flag, self.device_name, self.device_mac)
+        if not count and status == self._last_status:
+            return self.lines.values()
+        self._last_status = status
         
         # Always update connection status and device info
         if self.is_connected:
@@ -203,57 +327,50 @@ class LiveVibrationMonitor:
             self.lines['status_text'].set_color('yellow')
             self.lines['device_info'].set_text("")
 
+        # Total acceleration over the longest plotted window; the shorter
+        # windows below are its tail, so this is the only sqrt per redraw
+        recent_total = np.sqrt(self._recent_total_sq(100))
+        
         # Update real-time acceleration plot
-        if len(self.timestamps) > 0:
-            window = min(100, len(self.timestamps))
-            # Convert deques to lists for slicing
-            recent_times = list(self.timestamps)[-window:]
-            recent_acc = list(self.acc_total)[-window:]
+        if self._n > 0:
+            recent_acc = recent_total
             
             # Use simple x-axis (0 to window-1) for real-time plotting
-            x_data = list(range(len(recent_acc)))
-            self.lines['acc'].set_data(x_data, recent_acc)
+            self.lines['acc'].set_data(self._x_data[:len(recent_acc)], recent_acc)
             
             # Update y-axis limits to show data properly
             if len(recent_acc) > 0:
-                y_min = min(recent_acc) - 0.01
-                y_max = max(recent_acc) + 0.01
-                self.axes[0, 0].set_ylim(y_min, y_max)
+                y_min = recent_acc.min() - 0.01
+                y_max = recent_acc.max() + 0.01
+                self._update_ylim(self.axes[0, 0], y_min, y_max)
             
-            self.axes[0, 0].set_xlim(0, len(recent_acc))
+            self._update_xlim(self.axes[0, 0], len(recent_acc))
 
         # Update rolling statistics
-        if len(self.acc_total) >= 10:
-            window = min(50, len(self.acc_total))
-            # Convert deque to list for slicing
-            recent_data = list(self.acc_total)[-window:]
-            means = []
-            stds = []
-            peaks = []
-            for i in range(5, len(recent_data)):
-                window_data = recent_data[i-5:i+1]
-                means.append(np.mean(window_data))
-                stds.append(np.std(window_data))
-                peaks.append(np.max(window_data))
-            if means:
-                x_data = list(range(len(means)))
+        if self._n >= 10:
+            recent_data = recent_total[-50:]
+            # Every 6-sample window as a row of a strided 2-D view (no copy),
+            # reduced along the rows in one call per statistic
+            windows = np.lib.stride_tricks.sliding_window_view(recent_data, 6)
+            means = windows.mean(axis=1)
+            stds = windows.std(axis=1)
+            peaks = windows.max(axis=1)
+            if len(means):
+                x_data = self._x_data[:len(means)]
                 self.lines['mean'].set_data(x_data, means)
                 self.lines['std'].set_data(x_data, stds)
                 self.lines['peak'].set_data(x_data, peaks)
                 
                 # Update y-axis limits for stats
-                all_stats = means + stds + peaks
-                if all_stats:
-                    y_min = min(all_stats) - 0.01
-                    y_max = max(all_stats) + 0.01
-                    self.axes[0, 1].set_ylim(y_min, y_max)
+                y_min = min(means.min(), stds.min(), peaks.min()) - 0.01
+                y_max = max(means.max(), stds.max(), peaks.max()) + 0.01
+                self._update_ylim(self.axes[0, 1], y_min, y_max)
                 
-                self.axes[0, 1].set_xlim(0, len(means))
+                self._update_xlim(self.axes[0, 1], len(means))
 
         # Update status/alerts for vibration only if we have data
-        if len(self.acc_total) > 0:
-            # Convert deque to list for slicing
-            recent_acc = list(self.acc_total)[-10:]
+        if self._n > 0:
+            recent_acc = recent_total[-10:]
             current_mean = np.mean(recent_acc)
             current_peak = np.max(recent_acc)
             if current_mean < IDLE_BASELINE + 0.05:
@@ -284,10 +401,46 @@ class LiveVibrationMonitor:
 
         return self.lines.values()
     
+    def _update_ylim(self, ax, y_min, y_max):
+        """Refit y limits (with 10% headroom) only when the data leaves them or uses under a third of them"""
+        lo, hi = ax.get_ylim()
+        span = y_max - y_min
+        if lo <= y_min and y_max <= hi and hi - lo <= 3 * span:
+            return
+        margin = 0.1 * span
+        ax.set_ylim(y_min - margin, y_max + margin)
+    
+    def _update_xlim(self, ax, length):
+        """Set x limits to (0, length) unless they already are"""
+        if ax.get_xlim() != (0, length):
+            ax.set_xlim(0, length)
+    
+    def _extend(self, records):
+        """Write RING_DTYPE records into the ring buffer, overwriting the oldest when full"""
+        records = records[-RING_SIZE:]
+        count = len(records)
+        end = self._head + count
+        # Columns are written in at most two slices (the batch may wrap)
+        split = min(count, RING_SIZE - self._head)
+        for name, column in self._ring.items():
+            values = records[name]
+            column[self._head:self._head + split] = values[:split]
+            if split < count:
+                column[:count - split] = values[split:]
+        self._head = end % RING_SIZE
+        self._n = min(self._n + count, RING_SIZE)
+    
+    def _recent_total_sq(self, count):
+        """Last count (or fewer) squared total accelerations, oldest first"""
+        count = min(count, self._n)
+        start = self._head - count
+        if start >= 0:
+            return self._tot_sq[start:self._head]
+        # Window wraps around the end of the buffer
+        return np.concatenate((self._tot_sq[start:], self._tot_sq[:self._head]))
+    
     async def data_handler(self, sender, data):
         # Print first 16 bytes as hex and ASCII (only every 50th notification to reduce spam)
-        if not hasattr(self, '_notification_count'):
-            self._notification_count = 0
         self._notification_count += 1
         
         if self._notification_count % 50 == 0:
@@ -295,45 +448,128 @@ class LiveVibrationMonitor:
             ascii_bytes = ''.join(chr(b) if 32 <= b <= 126 else '.' for b in data[:16])
             print(f"Raw notification {self._notification_count} ({len(data)} bytes): {hex_bytes} | ASCII: {ascii_bytes}", flush=True)
         
-        # Frame splitting: Support both 0x55 0x51 (11 bytes) and 0x55 0x61 (16 bytes) formats
-        i = 0
-        while i < len(data):
-            if i + 11 <= len(data) and data[i] == 0x55 and data[i+1] == 0x51:
+        # One monotonic integer timestamp per notification; every frame in it
+        # arrived together. Parsing happens in _parser, so the callback only
+        # copies the bytes and returns.
+        try:
+            self._raw_q.put_nowait((bytes(data), time.monotonic_ns()))
+        except asyncio.QueueFull:
+            self._dropped += 1
+            if self._dropped % 100 == 1:
+                print(f"Parser behind: {self._dropped} notifications dropped", flush=True)
+    
+    async def _parser(self):
+        """Parse queued notifications in a worker thread, one at a time"""
+        while True:
+            raw, timestamp = await self._raw_q.get()
+            await asyncio.to_thread(self._parse_into_ring, raw, timestamp)
+    
+    def _parse_into_ring(self, data, timestamp):
+        """Split a notification into frames and append them to the inbox"""
+        readings = self.split_frames(data)
+        n = len(readings)
+        if n == 0:
+            return
+        
+        # Write the readings straight into the inbox (no per-notification
+        # allocation), then publish them by advancing _wpos
+        readings = readings[-INBOX_SIZE:]
+        count = len(readings)
+        pos = self._wpos % INBOX_SIZE
+        split = min(count, INBOX_SIZE - pos)
+        for name, column in zip(('x', 'y', 'z', 'tot_sq'), readings.T):
+            field = self._inbox[name]
+            field[pos:pos + split] = column[:split]
+            field[:count - split] = column[split:]
+        self._inbox['t'][pos:pos + split] = timestamp
+        self._inbox['t'][:count - split] = timestamp
+        self._wpos += count
+        
+        first = self.packet_count
+        self.packet_count += n
+        # Only print every 100th packet to reduce console spam
+        for k in range(99 - first % 100, n, 100):
+            acc_x, acc_y, acc_z, acc_sq = readings[k]
+            acc_total = math.sqrt(acc_sq)
+            print(f"Packet {first + k + 1}: AccX={acc_x:.4f}g, AccY={acc_y:.4f}g, AccZ={acc_z:.4f}g, Acc_total={acc_total:.4f}g", flush=True)
+    
+    def split_frames(self, data):
+        """
+        Split a notification into an (N, 4) float32 array of (acc_x, acc_y, acc_z, acc_total squared)
+        readings, one row per frame. The array may be reused by the next call.
+        """
+        # The sensor sends one frame format per session: once it is known,
+        # notifications made of whole frames take the fixed-stride path
+        if self._frame_len is not None and data and len(data) % self._frame_len == 0:
+            readings = self._split_fixed(data)
+            if readings is not None:
+                return readings
+        
+        readings = self._split_any(data)
+        if self._frame_len is None and len(readings) and data[0] == 0x55:
+            self._header = data[1]
+            self._frame_len = FRAME_LENGTHS.get(self._header)
+        return readings
+    
+    def _frame_buffer(self, max_frames):
+        """Scratch array for the compiled splitters, grown as needed"""
+        if max_frames > len(self._frames):
+            self._frames = np.empty((max_frames, 4), dtype=np.float32)
+        return self._frames
+    
+    def _split_fixed(self, data):
+        """Decode a notification of back-to-back frames of the session format; None if it isn't one"""
+        frame_len = self._frame_len
+        n = len(data) // frame_len
+        if njit is not None:
+            out = self._frame_buffer(n)
+            n = split_fixed(np.frombuffer(data, dtype=np.uint8), out, self._header, frame_len)
+            return out[:n] if n >= 0 else None
+        
+        # Without numba: check every header and decode all frames through
+        # strided views of the bytes
+        frames = np.frombuffer(data, dtype=np.uint8).reshape(n, frame_len)
+        if not ((frames[:, 0] == 0x55).all() and (frames[:, 1] == self._header).all()):
+            return None
+        raw = np.ndarray((n, 3), dtype='<i2', buffer=data, offset=2, strides=(frame_len, 2))
+        readings = np.empty((n, 4), dtype=np.float32)
+        readings[:, :3] = raw
+        readings[:, :3] *= np.float32(ACC_SCALE)
+        readings[:, 3] = (readings[:, :3] ** 2).sum(axis=1)
+        return readings
+    
+    def _split_any(self, data):
+        """Decode frames of either format found anywhere in the notification"""
+        if njit is not None:
+            out = self._frame_buffer(len(data) // 11)
+            n = split_and_parse(np.frombuffer(data, dtype=np.uint8), out)
+            return out[:n]
+        
+        # Frame splitting: Support both 0x55 0x51 (11 bytes) and 0x55 0x61 (16 bytes) formats.
+        # Headers are located with bytes.find (a C-level memchr scan) and the
+        # nearer of the two next header positions is taken each step.
+        readings = []
+        view = memoryview(data)
+        size = len(data)
+        next_standard = data.find(b'\x55\x51')
+        next_custom = data.find(b'\x55\x61')
+        while next_standard >= 0 or next_custom >= 0:
+            if next_custom < 0 or 0 <= next_standard < next_custom:
                 # Standard WT901 IMU frame (11 bytes)
-                frame = data[i:i+11]
-                acc_x, acc_y, acc_z, acc_total = self.parse_wt901_data(frame)
-                if acc_total is not None:
-                    timestamp = datetime.now()
-                    # Put data in queue for thread-safe access
-                    self.data_queue.put({
-                        'timestamp': timestamp,
-                        'acc_data': [acc_x, acc_y, acc_z],
-                        'acc_total': acc_total
-                    })
-                    self.packet_count += 1
-                    # Only print every 100th packet to reduce console spam
-                    if self.packet_count % 100 == 0:
-                        print(f"Packet {self.packet_count}: AccX={acc_x:.4f}g, AccY={acc_y:.4f}g, AccZ={acc_z:.4f}g, Acc_total={acc_total:.4f}g", flush=True)
-                i += 11
-            elif i + 16 <= len(data) and data[i] == 0x55 and data[i+1] == 0x61:
+                start, frame_len = next_standard, 11
+            else:
                 # Custom WT901BLE68 format (16 bytes)
-                frame = data[i:i+16]
-                acc_x, acc_y, acc_z, acc_total = self.parse_wt901_data(frame)
-                if acc_total is not None:
-                    timestamp = datetime.now()
-                    # Put data in queue for thread-safe access
-                    self.data_queue.put({
-                        'timestamp': timestamp,
-                        'acc_data': [acc_x, acc_y, acc_z],
-                        'acc_total': acc_total
-                    })
-                    self.packet_count += 1
-                    # Only print every 100th packet to reduce console spam
-                    if self.packet_count % 100 == 0:
-                        print(f"Packet {self.packet_count}: AccX={acc_x:.4f}g, AccY={acc_y:.4f}g, AccZ={acc_z:.4f}g, Acc_total={acc_total:.4f}g", flush=True)
-                i += 16
+                start, frame_len = next_custom, 16
+            if start + frame_len <= size:
+                readings.append(self.parse_wt901_data(view[start:start + frame_len]))
+                i = start + frame_len
             else:
-                i += 1
+                i = start + 1  # truncated frame; a shorter one may still follow
+            if 0 <= next_standard < i:
+                next_standard = data.find(b'\x55\x51', i)
+            if 0 <= next_custom < i:
+                next_custom = data.find(b'\x55\x61', i)
+        return np.array(readings, dtype=np.float32).reshape(-1, 4)
     
     async def connect_to_device(self, device):
         """Connect to WT901BLE68 device with debug and initialization"""
@@ -361,6 +597,8 @@ class LiveVibrationMonitor:
             except Exception as e:
                 print(f"Write to start streaming failed: {e}", flush=True)
             # Subscribe to notifications
+            if self._parser_task is None:
+                self._parser_task = asyncio.create_task(self._parser())
             try:
                 await self.client.start_notify(WT901_CHAR_UUID, self.data_handler)
                 print(f"Subscribed to notifications on {WT901_CHAR_UUID}", flush=True)
@@ -385,35 +623,72 @@ class LiveVibrationMonitor:
         print("Disconnected", flush=True)
 
     def on_change_device(self, event):
+        # Scanning needs the asyncio loop, which a GUI callback must not block
+        # (run_until_complete can't nest inside the running loop): hand the
+        # whole device change over to the loop and return straight away
+        asyncio.run_coroutine_threadsafe(self.change_device(), self._loop)
+
+    async def change_device(self):
         # Pause animation
         if self.ani:
             self.ani.event_source.stop()
-        # Scan and select device
-        new_device = self.scan_and_select_device()
-        if new_device:
-            asyncio.create_task(self.reconnect_to_device(new_device))
-        else:
-            print('No device selected.', flush=True)
-        if self.ani:
-            self.ani.event_source.start()
+        try:
+            # Scan and select device
+            new_device = await self.scan_and_select_device()
+            if new_device:
+                await self.reconnect_to_device(new_device)
+            else:
+                print('No device selected.', flush=True)
+        finally:
+            if self.ani:
+                self.ani.event_source.start()
 
-    def scan_and_select_device(self):
-        # Use tkinter for device selection dialog
-        loop = asyncio.get_event_loop()
-        devices, _ = loop.run_until_complete(scan_devices())
-        device_names = [f"{d.name or 'Unknown'} ({d.address})" for _, d in devices]
-        if not device_names:
+    async def scan_and_select_device(self):
+        scan_result = await scan_devices()
+        if not scan_result:
             return None
-        # Show dialog
+        devices, _ = scan_result
+        return self.choose_device(devices)
+
+    def choose_device(self, devices):
+        # Use tkinter for device selection dialog; the hidden Tk root is
+        # created once and reused for every dialog
         if not self.root:
             self.root = tk.Tk()
             self.root.withdraw()
-        selected = simpledialog.askstring('Select Device', 'Enter device number:\n' + '\n'.join(f"[{i}] {name}" for i, name in enumerate(device_names)))
-        if selected is None or not selected.isdigit():
-            return None
-        idx = int(selected)
-        if 0 <= idx < len(devices):
-            return devices[idx][1]
+        dialog = tk.Toplevel(self.root)
+        dialog.title('Select Device')
+        # One Treeview row per device (row iid = index into devices); scrolls
+        # instead of growing with the number of devices in range
+        frame = ttk.Frame(dialog)
+        frame.pack(fill='both', expand=True, padx=10, pady=10)
+        tree = ttk.Treeview(frame, columns=('name', 'address'), show='headings',
+                            selectmode='browse', height=min(len(devices), 15))
+        tree.heading('name', text='Name')
+        tree.heading('address', text='Address')
+        tree.column('name', width=240)
+        tree.column('address', width=180)
+        scrollbar = ttk.Scrollbar(frame, orient='vertical', command=tree.yview)
+        tree.configure(yscrollcommand=scrollbar.set)
+        tree.pack(side='left', fill='both', expand=True)
+        scrollbar.pack(side='right', fill='y')
+        for i, (_, d) in enumerate(devices):
+            tree.insert('', 'end', iid=str(i), values=(d.name or 'Unknown', d.address))
+        tree.selection_set('0')
+        tree.focus('0')
+        selected = []
+        def on_connect(event=None):
+            selection = tree.selection()
+            if selection:
+                selected.append(int(selection[0]))
+            dialog.destroy()
+        tree.bind('<Double-1>', on_connect)
+        tree.bind('<Return>', on_connect)
+        ttk.Button(dialog, text='Connect', command=on_connect).pack(pady=(0, 10))
+        dialog.grab_set()
+        self.root.wait_window(dialog)
+        if selected and 0 <= selected[0] < len(devices):
+            return devices[selected[0]][1]
         return None
 
     async def reconnect_to_device(self, device):
@@ -466,6 +741,7 @@ async def main():
     
     # Load baseline data
     monitor = LiveVibrationMonitor()
+    monitor._loop = asyncio.get_running_loop()
     monitor.load_baseline_data()
     
     # Setup plotting
@@ -490,7 +766,13 @@ async def main():
     if await monitor.connect_to_device(selected_device):
         monitor.ani = FuncAnimation(monitor.fig, monitor.update_plot, interval=100, blit=True)
         try:
-            plt.show()
+            # Pump the GUI from the loop instead of blocking it in plt.show(),
+            # so notifications and device changes are serviced while the
+            # window is open
+            plt.show(block=False)
+            while plt.fignum_exists(monitor.fig.number):
+                monitor.fig.canvas.flush_events()
+                await asyncio.sleep(0.01)
         except KeyboardInterrupt:
             print("\nStopping...", flush=True)
         finally:
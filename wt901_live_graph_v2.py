@@ -1,14 +1,16 @@
 #!/usr/bin/env python3
 """
-WT901BLE68 Live Vibration Monitor v2 - Background Threading with File Messaging
+WT901BLE68 Live Vibration Monitor v2 - Background Threading with In-Process Messaging
 Connects to WT901BLE68 sensor and displays live vibration data with baseline comparison
-Uses background BLE thread and file-based messaging for robust GUI updates
+Uses background BLE thread and in-memory messaging for robust GUI updates
 """
 
 import asyncio
 import struct
+import math
+import re
+import bisect
 import numpy as np
-import pandas as pd
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
 import matplotlib.dates as mdates
@@ -20,17 +22,40 @@ import argparse
 import sys
 import os
 import json
+import csv
 import threading
 import time
 import tempfile
 from collections import deque
 warnings.filterwarnings('ignore')
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to the NumPy/Python frame splitters and stats
+    njit = None
+
 # WT901BLE68 BLE characteristics
 WT901_SERVICE_UUID = "0000ffe5-0000-1000-8000-00805f9a34fb"
 WT901_CHAR_UUID = "0000ffe4-0000-1000-8000-00805f9a34fb"
 WT901_WRITE_CHAR_UUID = "0000ffe9-0000-1000-8000-00805f9a34fb"
 
+# Acceleration words (x, y, z int16, little-endian) at offset 2 of both frame
+# formats, and the raw-to-g scale (+-16 g full range)
+_ACC_STRUCT = struct.Struct('<hhh')
+_ACC_SCALE = 16.0 / 32768.0
+
+# The same three words as a record dtype per frame format (keyed by the
+# header's second byte), to decode a run of back-to-back frames at once
+_FRAME_DTYPES = {
+    header: np.dtype({'names': ['x', 'y', 'z'], 'formats': ['<i2'] * 3,
+                      'offsets': [2, 4, 6], 'itemsize': frame_len})
+    for header, frame_len in ((0x51, 11), (0x61, 16))
+}
+# Fewer frames than this are cheaper through the scalar path
+_BATCH_MIN_FRAMES = 4
+# Header of either frame format, for the scalar path's frame search
+_FRAME_RE = re.compile(rb'\x55[\x51\x61]')
+
 # Default device MAC address for Allora yacht
 DEFAULT_DEVICE_MAC = "CC726E53-F6B5-6245-D962-948F091FCBFA"
 
@@ -39,112 +64,300 @@ IDLE_BASELINE = 1.01  # g
 CRUISE_BASELINE = 1.03  # g
 WARNING_THRESHOLD = 0.2  # g increase from baseline
 
-# File-based messaging system
-MESSAGE_FILE = "vib_messages.json"
-STATUS_FILE = "vib_status.json"
-DATA_FILE = "vib_data.json"
+# Status panel alert (text, color) by level of the recent mean: a mean
+# above the i-th bound gets _ALERT_LEVELS[i + 1]
+_ALERT_BOUNDS = (1.03, 1.23)  # cruise baseline, warning threshold (g)
+_ALERT_LEVELS = (("", 'black'), ("Warning: Above Cruise", 'orange'), ("ALERT: Vibration High!", 'red'))
+
+# Readings logged from the GUI; also the source of the historical panel
+VIBRATION_LOG_FILE = "vibration_log.csv"
+
+# Messaging between BLE and GUI threads: most recent samples kept in a
+# memory-mapped ring file that other processes can open read-only
+# (read_sample_log). The file starts with a header whose first int64 is the
+# count of samples written, padded to a cache line
+MAX_SAMPLES = 1000
+DATA_LOG_FILE = "vib_log.bin"
+LOG_HEADER_BYTES = 64
+
+# Column order of the 'acc' values (float32) of a sample record
+SAMPLE_COLUMNS = ('acc_x', 'acc_y', 'acc_z', 'acc_total')
+
+# Fixed 24-byte sample record: monotonic ns timestamp + SAMPLE_COLUMNS
+SAMPLE_DTYPE = np.dtype([('t', '<i8'), ('acc', '<f4', (len(SAMPLE_COLUMNS),))])
+
+# Sample timestamps are time.monotonic_ns() values (int64); this maps them
+# to wall-clock time, for display only
+_MONOTONIC_ORIGIN = np.datetime64(time.time_ns() - time.monotonic_ns(), 'ns')
 
 TEST_CAPTURE_FILE = "test_capture.json"
 
+# Columns of the vibration log used for the baseline / historical plot
+LOG_MEAN_DTYPE = np.dtype([('timestamp', 'datetime64[s]'), ('mean_acc', 'f4')])
+
+
+def exponential_smooth(values, alpha):
+    """EMA of values (first output = first value), computed without a Python loop per value"""
+    values = np.asarray(values, dtype=np.float64)
+    out = np.empty(len(values))
+    decay = 1.0 - alpha
+    if not 0.0 < decay < 1.0:
+        # alpha = 1 follows the values; alpha = 0 holds the first one
+        out[:] = values if decay <= 0.0 else values[:1]
+        return out
+    # Closed form over a block following an EMA value last:
+    #   ema[j] = d**(j+1) * (last + sum(alpha * v[k] / d**(k+1) for k in 0..j)), d = 1 - alpha
+    # Blocks are cut short enough that d**len stays far from underflow
+    # (which would turn the result into NaN on long inputs)
+    block = max(1, int(-200.0 / np.log10(decay)))
+    last = values[0] if len(values) else 0.0
+    for start in range(0, len(values), block):
+        chunk = values[start:start + block]
+        powers = decay ** np.arange(1, len(chunk) + 1)
+        out[start:start + len(chunk)] = powers * (last + np.cumsum(alpha * chunk / powers))
+        last = out[start + len(chunk) - 1]
+    return out
+
+
+def rolling_stats(values, window):
+    """Mean, std and max of every window-sample run of values, in O(len(values))"""
+    values = np.asarray(values, dtype=np.float64)
+    count = len(values) - window + 1
+    if count <= 0:
+        empty = np.empty(0)
+        return empty, empty, empty
+    
+    # The values are centred first so the sum of squares doesn't cancel out
+    # the (small) variance
+    offset = values.mean()
+    if njit is not None:
+        means = np.empty(count)
+        stds = np.empty(count)
+        peaks = np.empty(count)
+        fused_rolling(values, window, offset, means, stds, peaks)
+        return means + offset, stds, peaks
+    
+    # Window sums as differences of prefix sums
+    centred = values - offset
+    csum = np.concatenate(([0.0], np.cumsum(centred)))
+    csum2 = np.concatenate(([0.0], np.cumsum(centred * centred)))
+    means = (csum[window:] - csum[:-window]) / window
+    variances = (csum2[window:] - csum2[:-window]) / window - means * means
+    stds = np.sqrt(np.maximum(variances, 0.0))
+    
+    # Sliding max (van Herk/Gil-Werman): with the values cut into blocks of
+    # window samples, window [i, i + window) is the suffix of one block from i
+    # plus the prefix of the next up to i + window - 1
+    blocks = -(-len(values) // window)
+    padded = np.full(blocks * window, -np.inf)
+    padded[:len(values)] = values
+    padded = padded.reshape(blocks, window)
+    prefix_max = np.maximum.accumulate(padded, axis=1).ravel()
+    suffix_max = np.maximum.accumulate(padded[:, ::-1], axis=1)[:, ::-1].ravel()
+    peaks = np.maximum(suffix_max[:count], prefix_max[window - 1:window - 1 + count])
+    return means + offset, stds, peaks
+
+
+def monotonic_to_datetime64(ts_ns):
+    """Wall-clock datetime64[ns] for time.monotonic_ns() timestamps"""
+    return _MONOTONIC_ORIGIN + np.asarray(ts_ns, dtype=np.int64).astype('timedelta64[ns]')
+
+
+def samples_from_records(records, t=0):
+    """Convert saved sample dicts (mock/test JSON files) to SAMPLE_DTYPE records stamped t"""
+    samples = np.empty(len(records), dtype=SAMPLE_DTYPE)
+    samples['t'] = t
+    for i, r in enumerate(records):
+        samples['acc'][i] = [r[c] for c in SAMPLE_COLUMNS]
+    return samples
+
+
+def latest_samples(log, cursor, max_points):
+    """Copy of the latest max_points records of a ring that has had cursor samples written, oldest first"""
+    count = min(max_points, cursor, len(log))
+    rows = np.arange(cursor - count, cursor) % len(log)
+    return np.asarray(log[rows])
+
+
+def read_sample_log(path=DATA_LOG_FILE, max_points=MAX_SAMPLES):
+    """Latest SAMPLE_DTYPE records from a sample log written by another process (mapped read-only)"""
+    raw = np.memmap(path, dtype=np.uint8, mode='r')
+    cursor = int(raw[:8].view(np.int64)[0])
+    # The writer only advances the cursor after a batch's records are in
+    # place; when reading all MAX_SAMPLES the oldest may be overwritten meanwhile
+    return latest_samples(raw[LOG_HEADER_BYTES:].view(SAMPLE_DTYPE), cursor, max_points)
+
+
+def read_mean_log(path):
+    """
+    Timestamp and Mean_Acc_g columns of a vibration log CSV as a LOG_MEAN_DTYPE array
+    (unparseable timestamps become NaT, means NaN); None if either column is missing
+    """
+    with open(path, newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        if 'Timestamp' not in header or 'Mean_Acc_g' not in header:
+            return None
+        ts_col = header.index('Timestamp')
+        mean_col = header.index('Mean_Acc_g')
+        rows = [(row[ts_col], row[mean_col]) for row in reader if len(row) > max(ts_col, mean_col)]
+    log = np.empty(len(rows), dtype=LOG_MEAN_DTYPE)
+    for i, (timestamp, mean_acc) in enumerate(rows):
+        try:
+            log['timestamp'][i] = np.datetime64(timestamp, 's')
+        except ValueError:
+            log['timestamp'][i] = np.datetime64('NaT')
+        try:
+            log['mean_acc'][i] = float(mean_acc)
+        except ValueError:
+            log['mean_acc'][i] = np.nan
+    return log
+
+
+# Compiled frame splitter (numba only): walks the notification bytes once,
+# decoding every 0x51 (11 byte) and 0x61 (16 byte) frame into a row of out
+# as (x, y, z, total) in g, and returns the number of frames found. Float64
+# like parse_wt901_data, so both give the same rows.
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def split_and_parse(buf, out):
+        n = 0
+        i = 0
+        size = buf.size
+        while i < size - 1:
+            if buf[i] == 0x55 and buf[i + 1] == 0x51 and i + 11 <= size:
+                frame_len = 11
+            elif buf[i] == 0x55 and buf[i + 1] == 0x61 and i + 16 <= size:
+                frame_len = 16
+            else:
+                i += 1
+                continue
+            total_sq = 0.0
+            for k in range(3):
+                raw = np.int32(buf[i + 2 + 2 * k]) | (np.int32(buf[i + 3 + 2 * k]) << 8)
+                if raw >= 32768:
+                    raw -= 65536
+                value = raw * _ACC_SCALE
+                out[n, k] = value
+                total_sq += value * value
+            out[n, 3] = np.sqrt(total_sq)
+            n += 1
+            i += frame_len
+        return n
+    
+    # Fused rolling statistics (numba only): one pass over values keeping a
+    # running sum and sum of squares (both of values - offset) and a
+    # monotonic deque of max candidates, writing the centred mean, std and
+    # max of window i to means/stds/peaks[i]
+    @njit(cache=True, fastmath=True)
+    def fused_rolling(values, window, offset, means, stds, peaks):
+        s = 0.0
+        s2 = 0.0
+        # Ring of indices whose values decrease from head to tail; the head
+        # is the max of the current window
+        candidates = np.empty(window, dtype=np.int64)
+        head = 0
+        size = 0
+        for k in range(values.size):
+            if size and candidates[head] <= k - window:
+                head = (head + 1) % window
+                size -= 1
+            v = values[k]
+            while size and values[candidates[(head + size - 1) % window]] <= v:
+                size -= 1
+            candidates[(head + size) % window] = k
+            size += 1
+            
+            v -= offset
+            s += v
+            s2 += v * v
+            if k >= window:
+                v = values[k - window] - offset
+                s -= v
+                s2 -= v * v
+            
+            i = k - window + 1
+            if i >= 0:
+                mean = s / window
+                means[i] = mean
+                stds[i] = math.sqrt(max(s2 / window - mean * mean, 0.0))
+                peaks[i] = values[candidates[head]]
+    
+    # Compile (or load from cache) now rather than on first use
+    split_and_parse(np.zeros(16, dtype=np.uint8), np.empty((1, 4)))
+    fused_rolling(np.zeros(2), 1, 0.0, np.empty(2), np.empty(2), np.empty(2))
+
 class FileMessenger:
-    """File-based messaging system for BLE-GUI communication"""
+    """In-process messaging between the BLE thread and the GUI thread"""
     
     def __init__(self):
-        self.message_file = MESSAGE_FILE
-        self.status_file = STATUS_FILE
-        self.data_file = DATA_FILE
+        # Messages and status live in memory, shared by the BLE producer and
+        # the GUI consumer. Messages go through a deque, whose append and
+        # popleft are atomic, so they need no lock; status and samples share
+        # one lock. Samples are a ring of SAMPLE_DTYPE
+        # records mapped onto DATA_LOG_FILE after its header, so a batch is
+        # one slice store into the page cache that a GUI in another process
+        # can pick up with read_sample_log. cursor counts every sample
+        # written, so the newest is at (cursor - 1) % MAX_SAMPLES; it is
+        # published in the header once a batch's records are written
+        raw = np.memmap(DATA_LOG_FILE, dtype=np.uint8, mode='w+',
+                        shape=(LOG_HEADER_BYTES + MAX_SAMPLES * SAMPLE_DTYPE.itemsize,))
+        self.header = raw[:LOG_HEADER_BYTES].view(np.int64)
+        self.log = raw[LOG_HEADER_BYTES:].view(SAMPLE_DTYPE)
+        self.cursor = 0
+        self._msgs = deque(maxlen=100)
+        self._status = {'connected': False, 'device_name': None, 'device_mac': None}
+        # Bumped on every status update, so readers can tell nothing changed
+        # (as cursor does for samples) without taking the lock
+        self.status_seq = 0
         self.lock = threading.Lock()
     
     def send_message(self, message_type, data):
         """Send a message to the GUI thread"""
-        with self.lock:
-            message = {
-                'timestamp': datetime.now().isoformat(),
-                'type': message_type,
-                'data': data
-            }
-            try:
-                with open(self.message_file, 'w') as f:
-                    json.dump(message, f)
-            except Exception as e:
-                print(f"Error sending message: {e}", flush=True)
+        message = {
+            'timestamp': time.monotonic_ns(),  # same clock as the samples
+            'type': message_type,
+            'data': data
+        }
+        self._msgs.append(message)
     
     def get_message(self):
-        """Get the latest message from BLE thread"""
-        with self.lock:
-            try:
-                if os.path.exists(self.message_file):
-                    with open(self.message_file, 'r') as f:
-                        message = json.load(f)
-                    # Delete the message after reading
-                    os.remove(self.message_file)
-                    return message
-            except Exception as e:
-                print(f"Error reading message: {e}", flush=True)
-        return None
+        """Get the oldest pending message from BLE thread, or None"""
+        try:
+            return self._msgs.popleft()
+        except IndexError:
+            return None
     
     def update_status(self, status_data):
         """Update connection status"""
         with self.lock:
-            try:
-                with open(self.status_file, 'w') as f:
-                    json.dump(status_data, f)
-            except Exception as e:
-                print(f"Error updating status: {e}", flush=True)
+            self._status = dict(status_data)
+            self.status_seq += 1
     
     def get_status(self):
         """Get current status"""
         with self.lock:
-            try:
-                if os.path.exists(self.status_file):
-                    with open(self.status_file, 'r') as f:
-                        return json.load(f)
-            except Exception as e:
-                print(f"Error reading status: {e}", flush=True)
-        return {'connected': False, 'device_name': None, 'device_mac': None}
+            return dict(self._status)
     
-    def save_data_batch(self, data_batch):
-        """Save a batch of vibration data"""
+    def save_data_batch(self, samples):
+        """Save a batch of vibration data (SAMPLE_DTYPE records)"""
+        samples = samples[-MAX_SAMPLES:]
+        count = len(samples)
         with self.lock:
-            try:
-                print(f"DEBUG: Saving batch of {len(data_batch)} data points", flush=True)
-                # Append to existing data or create new file
-                existing_data = []
-                if os.path.exists(self.data_file):
-                    try:
-                        with open(self.data_file, 'r') as f:
-                            existing_data = json.load(f)
-                        print(f"DEBUG: Loaded {len(existing_data)} existing data points", flush=True)
-                    except:
-                        existing_data = []
-                        print(f"DEBUG: No existing data or error loading, starting fresh", flush=True)
-                
-                # Add new data
-                existing_data.extend(data_batch)
-                print(f"DEBUG: Total data points after adding batch: {len(existing_data)}", flush=True)
-                
-                # Keep only last 1000 data points to prevent file bloat
-                if len(existing_data) > 1000:
-                    existing_data = existing_data[-1000:]
-                    print(f"DEBUG: Trimmed to last 1000 data points", flush=True)
-                
-                with open(self.data_file, 'w') as f:
-                    json.dump(existing_data, f)
-                print(f"DEBUG: Successfully saved {len(existing_data)} data points to {self.data_file}", flush=True)
-            except Exception as e:
-                print(f"Error saving data: {e}", flush=True)
+            # Copied in at most two slices; the oldest records are overwritten
+            start = self.cursor % MAX_SAMPLES
+            split = min(count, MAX_SAMPLES - start)
+            self.log[start:start + split] = samples[:split]
+            self.log[:count - split] = samples[split:]
+            self.cursor += count
+            self.header[0] = self.cursor
+            total = min(self.cursor, MAX_SAMPLES)
+        print(f"DEBUG: Saved batch of {count} data points ({total} buffered)", flush=True)
     
     def get_latest_data(self, max_points=100):
-        """Get latest vibration data"""
+        """Get a copy of the latest SAMPLE_DTYPE records, oldest first"""
         with self.lock:
-            try:
-                if os.path.exists(self.data_file):
-                    with open(self.data_file, 'r') as f:
-                        data = json.load(f)
-                    return data[-max_points:] if len(data) > max_points else data
-            except Exception as e:
-                print(f"Error reading data: {e}", flush=True)
-        return []
+            return latest_samples(self.log, self.cursor, max_points)
 
 class BLEHandler:
     """Background BLE handler for WT901BLE68"""
@@ -156,31 +369,33 @@ class BLEHandler:
         self.device_name = None
         self.device_mac = None
         self.packet_count = 0
-        self.data_batch = []
         self.batch_size = 50  # Send data in batches
+        # Producer-local batch, copied into the messenger when full
+        self.data_batch = np.empty(self.batch_size, dtype=SAMPLE_DTYPE)
+        # Field views made once; indexing a field builds a new view each time
+        self._batch_acc = self.data_batch['acc']
+        self._batch_t = self.data_batch['t']
+        self.batch_count = 0
+        self._frames = np.empty((64, 4))  # compiled splitter scratch
+        self._notification_count = 0
     
     def parse_wt901_data(self, data):
         """Parse WT901BLE68 acceleration data from BLE packet - supports both 0x51 and 0x61 formats"""
         try:
-            if len(data) >= 11 and data[0] == 0x55 and data[1] == 0x51:
-                # Standard WT901 IMU frame (11 bytes)
-                acc_x = struct.unpack('<h', data[2:4])[0] / 32768.0 * 16  # Convert to g
-                acc_y = struct.unpack('<h', data[4:6])[0] / 32768.0 * 16
-                acc_z = struct.unpack('<h', data[6:8])[0] / 32768.0 * 16
-                
-            elif len(data) >= 16 and data[0] == 0x55 and data[1] == 0x61:
-                # Custom WT901BLE68 format (16 bytes) - acceleration in positions 2-7
-                acc_x = struct.unpack('<h', data[2:4])[0] / 32768.0 * 16
-                acc_y = struct.unpack('<h', data[4:6])[0] / 32768.0 * 16
-                acc_z = struct.unpack('<h', data[6:8])[0] / 32768.0 * 16
-                
-            else:
+            # Standard WT901 IMU frame (11 bytes) or custom WT901BLE68 format
+            # (16 bytes) - both carry acceleration in positions 2-7
+            is_standard = len(data) >= 11 and data[0] == 0x55 and data[1] == 0x51
+            is_custom = len(data) >= 16 and data[0] == 0x55 and data[1] == 0x61
+            if not (is_standard or is_custom):
                 return None, None, None, None
             
-            # Calculate total acceleration
-            acc_total = np.sqrt(acc_x**2 + acc_y**2 + acc_z**2)
+            # All three axes in one unpack, straight from the buffer
+            x, y, z = _ACC_STRUCT.unpack_from(data, 2)
             
-            return acc_x, acc_y, acc_z, acc_total
+            # Convert to g; total acceleration from the raw values (exact,
+            # as the scale is a power of two)
+            return (x * _ACC_SCALE, y * _ACC_SCALE, z * _ACC_SCALE,
+                    math.sqrt(x * x + y * y + z * z) * _ACC_SCALE)
         except Exception as e:
             print(f"Error parsing data: {e}", flush=True)
         return None, None, None, None
@@ -188,60 +403,142 @@ class BLEHandler:
     async def data_handler(self, sender, data):
         """Handle incoming BLE data"""
         # Print raw notifications occasionally
-        if not hasattr(self, '_notification_count'):
-            self._notification_count = 0
-        self._notification_count += 1
+        notification_count = self._notification_count + 1
+        self._notification_count = notification_count
         
-        if self._notification_count % 100 == 0:
+        if notification_count % 100 == 0:
             hex_bytes = ' '.join(f'{b:02x}' for b in data[:16])
-            print(f"Raw notification {self._notification_count} ({len(data)} bytes): {hex_bytes}", flush=True)
+            print(f"Raw notification {notification_count} ({len(data)} bytes): {hex_bytes}", flush=True)
+        
+        # Compiled splitter decodes every frame of the notification in one call
+        if njit is not None:
+            frames = self._frames
+            if len(data) // 11 > len(frames):
+                frames = self._frames = np.empty((len(data) // 11, 4))
+            n = split_and_parse(np.frombuffer(data, dtype=np.uint8), frames)
+            self.process_acceleration_batch(frames[:n])
+            return
         
-        # Frame splitting: Support both 0x55 0x51 (11 bytes) and 0x55 0x61 (16 bytes) formats
-        i = 0
-        while i < len(data):
-            if i + 11 <= len(data) and data[i] == 0x55 and data[i+1] == 0x51:
-                # Standard WT901 IMU frame (11 bytes)
-                frame = data[i:i+11]
-                acc_x, acc_y, acc_z, acc_total = self.parse_wt901_data(frame)
-                if acc_total is not None:
-                    self.process_acceleration_data(acc_x, acc_y, acc_z, acc_total)
-                i += 11
-            elif i + 16 <= len(data) and data[i] == 0x55 and data[i+1] == 0x61:
-                # Custom WT901BLE68 format (16 bytes)
-                frame = data[i:i+16]
-                acc_x, acc_y, acc_z, acc_total = self.parse_wt901_data(frame)
-                if acc_total is not None:
-                    self.process_acceleration_data(acc_x, acc_y, acc_z, acc_total)
-                i += 16
+        # Fast path: a notification made only of frames of one format is
+        # decoded in one go
+        values = self.parse_frame_run(data)
+        if values is not None:
+            self.process_acceleration_batch(values)
+            return
+        
+        # Frame splitting: Support both 0x55 0x51 (11 bytes) and 0x55 0x61 (16 bytes) formats.
+        # The regex search jumps straight to the next header (in C); a
+        # header without a whole frame behind it is skipped
+        search = _FRAME_RE.search
+        size = len(data)
+        offsets = []
+        match = search(data)
+        while match:
+            i = match.start()
+            frame_len = 11 if data[i + 1] == 0x51 else 16
+            if i + frame_len <= size:
+                offsets.append(i)
+                i += frame_len
             else:
                 i += 1
+            match = search(data, i)
+        
+        # Mixed or garbled notifications with enough frames are still
+        # decoded in one go, the rest frame by frame
+        if len(offsets) >= _BATCH_MIN_FRAMES:
+            self.process_acceleration_batch(self.parse_frames_at(data, offsets))
+            return
+        parse = self.parse_wt901_data
+        process = self.process_acceleration_data
+        for i in offsets:
+            frame_len = 11 if data[i + 1] == 0x51 else 16
+            acc_x, acc_y, acc_z, acc_total = parse(data[i:i + frame_len])
+            if acc_total is not None:
+                process(acc_x, acc_y, acc_z, acc_total)
+    
+    def parse_frame_run(self, data):
+        """Decode a notification of back-to-back frames of one format to (N, 4) rows; None if it isn't one"""
+        if len(data) < 2 or data[0] != 0x55 or data[1] not in _FRAME_DTYPES:
+            return None
+        frame_dtype = _FRAME_DTYPES[data[1]]
+        frame_len = frame_dtype.itemsize
+        n, extra = divmod(len(data), frame_len)
+        if extra or n < _BATCH_MIN_FRAMES:
+            return None
+        if data[0::frame_len] != b'\x55' * n or data[1::frame_len] != bytes([data[1]]) * n:
+            return None
+        frames = np.frombuffer(data, dtype=frame_dtype)
+        values = np.empty((n, 4))
+        values[:, 0] = frames['x']
+        values[:, 1] = frames['y']
+        values[:, 2] = frames['z']
+        return self._scale_rows(values)
+    
+    def parse_frames_at(self, data, offsets):
+        """Decode the frames starting at offsets of data (either format) to (N, 4) rows"""
+        # Gather the six acceleration bytes of every frame, then read them as
+        # little-endian int16 words
+        buf = np.frombuffer(data, dtype=np.uint8)
+        words = buf[np.asarray(offsets)[:, None] + np.arange(2, 8)].view('<i2')
+        values = np.empty((len(offsets), 4))
+        values[:, :3] = words
+        return self._scale_rows(values)
+    
+    def _scale_rows(self, values):
+        """Scale raw x, y, z in values[:, :3] to g and fill in the total in values[:, 3]"""
+        values[:, :3] *= _ACC_SCALE
+        # Float64 throughout, so rows match parse_wt901_data exactly
+        values[:, 3] = np.sqrt(np.einsum('ij,ij->i', values[:, :3], values[:, :3]))
+        return values
+    
+    def process_acceleration_batch(self, values):
+        """Process and store (N, 4) rows of acceleration data from one notification"""
+        timestamp = time.monotonic_ns()
+        batch_size = self.batch_size
+        while len(values):
+            # Bulk copy as many rows as fit in the current batch
+            row = self.batch_count
+            take = min(len(values), batch_size - row)
+            chunk, values = values[:take], values[take:]
+            self._batch_acc[row:row + take] = chunk
+            self._batch_t[row:row + take] = timestamp
+            self.batch_count = row + take
+            first = self.packet_count
+            self.packet_count = first + take
+            
+            # Print every 100th packet
+            for k in range(99 - first % 100, take, 100):
+                acc_x, acc_y, acc_z, acc_total = chunk[k]
+                print(f"Packet {first + k + 1}: AccX={acc_x:.4f}g, AccY={acc_y:.4f}g, AccZ={acc_z:.4f}g, Acc_total={acc_total:.4f}g", flush=True)
+            
+            if row + take >= batch_size:
+                self.send_data_batch()
     
     def process_acceleration_data(self, acc_x, acc_y, acc_z, acc_total):
         """Process and store acceleration data"""
-        timestamp = datetime.now().isoformat()
-        data_point = {
-            'timestamp': timestamp,
-            'acc_x': acc_x,
-            'acc_y': acc_y,
-            'acc_z': acc_z,
-            'acc_total': acc_total
-        }
-        
-        self.data_batch.append(data_point)
-        self.packet_count += 1
+        row = self.batch_count
+        self._batch_t[row] = time.monotonic_ns()
+        self._batch_acc[row] = (acc_x, acc_y, acc_z, acc_total)
+        self.batch_count = row + 1
+        packet_count = self.packet_count + 1
+        self.packet_count = packet_count
         
         # Print every 100th packet
-        if self.packet_count % 100 == 0:
-            print(f"Packet {self.packet_count}: AccX={acc_x:.4f}g, AccY={acc_y:.4f}g, AccZ={acc_z:.4f}g, Acc_total={acc_total:.4f}g", flush=True)
+        if packet_count % 100 == 0:
+            print(f"Packet {packet_count}: AccX={acc_x:.4f}g, AccY={acc_y:.4f}g, AccZ={acc_z:.4f}g, Acc_total={acc_total:.4f}g", flush=True)
         
         # Send data batch when it reaches the batch size
-        if len(self.data_batch) >= self.batch_size:
-            self.messenger.save_data_batch(self.data_batch)
-            self.messenger.send_message('data_update', {
-                'packet_count': self.packet_count,
-                'batch_size': len(self.data_batch)
-            })
-            self.data_batch = []
+        if row + 1 >= self.batch_size:
+            self.send_data_batch()
+    
+    def send_data_batch(self):
+        """Hand the current batch to the GUI thread and start a new one"""
+        self.messenger.save_data_batch(self.data_batch[:self.batch_count])
+        self.messenger.send_message('data_update', {
+            'packet_count': self.packet_count,
+            'batch_size': self.batch_count
+        })
+        self.batch_count = 0
     
     async def connect_to_device(self, device):
         """Connect to WT901BLE68 device"""
@@ -335,11 +632,14 @@ class LiveVibrationMonitor:
         self.test_data_index = 0
         self.test_start_time = None
         
-        # Data storage
-        self.acc_data = deque(maxlen=1000)
-        self.timestamps = deque(maxlen=1000)
-        self.acc_total = deque(maxlen=1000)
+        # Data storage: latest samples copied from the messenger each tick
+        # (acc_data is an (N, 3) view, acc_total a column of the same rows)
+        self.acc_data = np.empty((0, 3), dtype=np.float32)
+        self.timestamps = np.empty(0, dtype=np.int64)
+        self.acc_total = np.empty(0, dtype=np.float32)
         self.baseline_data = None
+        # ((path, mtime, size), read_mean_log result) of the last log parsed
+        self._log_cache = None
         
         # GUI components
         self.fig, self.axes = None, None
@@ -353,10 +653,19 @@ class LiveVibrationMonitor:
         self.device_name = None
         self.device_mac = None
         self.packet_count = 0
+        self._cursor_seen = None  # messenger cursor / status_seq at the last read
+        self._status_seq_seen = None
         
         self.showing_historical = False  # Always start in live mode
         self.toggle_button = None
         self.show_status = True  # Status is default view
+        # The lower right panel ('status' or 'historical') is only rebuilt
+        # when switching to it; status texts are only set when their value
+        # changes
+        self._lower_right_panel = None
+        self._historical_key = None  # log file state the historical panel shows
+        self._text_cache = {}
+        self._last_pkt_update = 0.0
         self.capturing_test = False
         self.replaying_test = test_mode
         self.data_source_status = 'Live BLE Data' if not test_mode else 'Test Data Replay'
@@ -377,15 +686,30 @@ class LiveVibrationMonitor:
             self.status_button.label.set_text(new_label)
             print(f"DEBUG: Button label updated to '{new_label}' (show_status={self.show_status})", flush=True)
         
+    def _log_key(self, log_path):
+        """(path, mtime, size) of log_path, or None if it doesn't exist"""
+        try:
+            stat = os.stat(log_path)
+        except OSError:
+            return None
+        return (log_path, stat.st_mtime_ns, stat.st_size)
+    
+    def load_mean_log(self, log_path=VIBRATION_LOG_FILE):
+        """read_mean_log(log_path), only parsed again once the file has changed"""
+        key = self._log_key(log_path)
+        if self._log_cache is None or self._log_cache[0] != key:
+            self._log_cache = (key, read_mean_log(log_path))
+        return self._log_cache[1]
+    
     def load_baseline_data(self):
         """Load historical vibration data for comparison"""
         try:
-            if pd.io.common.file_exists('vibration_log.csv'):  # Fixed: Use correct path
-                df = pd.read_csv('vibration_log.csv')  # Fixed: Use correct path
-                df['timestamp'] = pd.to_datetime(df['Timestamp'], format='ISO8601', errors='coerce')
-                df['mean_acc'] = df['Mean_Acc_g']  # Fixed: Use correct column name
-                self.baseline_data = df
-                print(f"Loaded {len(df)} historical readings", flush=True)
+            if os.path.exists(VIBRATION_LOG_FILE):
+                # Only the timestamp and mean columns, as a structured array
+                self.baseline_data = self.load_mean_log()
+                if self.baseline_data is None:
+                    raise ValueError(f"{VIBRATION_LOG_FILE} has no Timestamp/Mean_Acc_g columns")
+                print(f"Loaded {len(self.baseline_data)} historical readings", flush=True)
             else:
                 print("No historical data found - using default baselines", flush=True)
                 self.baseline_data = None
@@ -469,7 +793,7 @@ class LiveVibrationMonitor:
         self.lines['alert'] = ax4.text(0.1, 0.2, '', fontsize=16, fontweight='bold',
                                       transform=ax4.transAxes, color='green')
         self.lines['device_info'] = ax4.text(0.1, 0.95, '', fontsize=12, 
-                                            transform=ax4.transAxes, color='blue', fontweight='bold')
+                                            transform=ax4.transAxes, color='blue', fontweight='bold', va='top')
         self.lines['packet_count'] = ax4.text(0.1, 0.05, '', fontsize=12, 
                                              transform=ax4.transAxes, color='purple', fontweight='bold')
         # Initialize historical plot elements (initially hidden)
@@ -503,8 +827,18 @@ class LiveVibrationMonitor:
             print(f"  - Button test error: {e}", flush=True)
         
         plt.tight_layout(rect=[0, 0, 0.98, 0.8])
+        # Sample positions for the plotted windows (at most 100 samples),
+        # sliced instead of rebuilt each frame
+        self._x100 = np.arange(100)
         # Top-left: Live Acceleration plot
         self.lines['acc'], = self.axes[0, 0].plot([], [], 'b-', label='Acc Total')
+        # Reference lines and legend are static, so drawn once into the
+        # background, under the (blitted) data line
+        self.reference_lines = [
+            self.axes[0, 0].axhline(1.01, color='blue', linestyle='--', linewidth=1, label='Idle Baseline (1.01g)', zorder=1.5),
+            self.axes[0, 0].axhline(1.03, color='orange', linestyle='--', linewidth=1, label='Cruise Baseline (1.03g)', zorder=1.5),
+            self.axes[0, 0].axhline(1.23, color='red', linestyle='--', linewidth=1, label='Warning Threshold (1.23g)', zorder=1.5),
+        ]
         self.axes[0, 0].set_title('Live Acceleration (g)')
         self.axes[0, 0].set_ylabel('g')
         self.axes[0, 0].set_xlabel('Sample')
@@ -573,7 +907,7 @@ class LiveVibrationMonitor:
             return
         
         # Calculate current statistics
-        recent_acc = list(self.acc_total)[-30:]  # Last 30 points
+        recent_acc = self.acc_total[-30:]  # Last 30 points
         mean_acc = np.mean(recent_acc)
         std_dev = np.std(recent_acc)
         peak_acc = np.max(recent_acc)
@@ -671,7 +1005,7 @@ class LiveVibrationMonitor:
     def log_vibration_data(self, mean_acc, std_dev, peak_acc, rpm=None, speed=None, comments=None):
         """Log vibration data to CSV with annotations"""
         timestamp = datetime.now().isoformat()
-        log_path = 'vibration_log.csv'  # Fixed: Use correct path in root directory
+        log_path = VIBRATION_LOG_FILE
         
         # Determine status based on mean acceleration
         if mean_acc > 1.23:
@@ -711,7 +1045,6 @@ class LiveVibrationMonitor:
         ]
         
         # Write to CSV
-        import csv
         write_header = not os.path.exists(log_path)
         with open(log_path, 'a', newline='') as f:
             writer = csv.writer(f)
@@ -842,6 +1175,7 @@ class LiveVibrationMonitor:
                 
                 with open(mock_data_file, 'r') as f:
                     mock_data = json.load(f)
+                samples = samples_from_records(mock_data)
                 
                 print(f"Loaded {len(mock_data)} mock data points", flush=True)
                 
@@ -851,10 +1185,9 @@ class LiveVibrationMonitor:
                     if index >= len(mock_data):
                         index = 0  # Loop back to start
                     
-                    data_point = mock_data[index]
-                    
                     # Send data through messenger
-                    self.messenger.save_data_batch([data_point])
+                    samples['t'][index] = time.monotonic_ns()
+                    self.messenger.save_data_batch(samples[index:index + 1])
                     
                     index += 1
                     time.sleep(0.1)  # 10 Hz replay rate
@@ -902,35 +1235,44 @@ class LiveVibrationMonitor:
         ax = self.axes[1, 1]
         
         if self.show_status:
-            ax.clear()  # Clear any previous plot lines, legends, or artifacts
-            ax.set_title('Status & Alerts', fontweight='bold')
-            ax.axis('off')
-            # Re-create status text objects if missing (after ax.clear())
-            for key, props in [
-                ('status_text', dict(x=0.1, y=0.8, s='Connecting...', fontsize=16, color='orange', fontweight='bold')),
-                ('current_val', dict(x=0.1, y=0.6, s='', fontsize=14, color='black', fontweight='bold')),
-                ('baseline_diff', dict(x=0.1, y=0.4, s='', fontsize=14, color='black', fontweight='bold')),
-                ('alert', dict(x=0.1, y=0.2, s='', fontsize=16, color='green', fontweight='bold')),
-                ('device_info', dict(x=0.1, y=0.95, s='', fontsize=12, color='blue', fontweight='bold')),
-                ('packet_count', dict(x=0.1, y=0.05, s='', fontsize=12, color='purple', fontweight='bold'))
-            ]:
-                if key not in self.lines or self.lines[key] not in ax.texts:
-                    self.lines[key] = ax.text(props['x'], props['y'], props['s'], fontsize=props['fontsize'],
-                                              transform=ax.transAxes, color=props['color'], fontweight=props['fontweight'])
-                    # Only print debug for text creation occasionally, and not in slow animation mode
-                    if (not hasattr(self, '_slow_animation_mode') or not self._slow_animation_mode) and \
-                       (not hasattr(self, '_last_text_creation_time') or time.time() - self._last_text_creation_time > 2.0):
-                        print(f"DEBUG: Re-created text objects for status panel", flush=True)
-                        self._last_text_creation_time = time.time()
-            # Hide all historical elements
-            for key in self.historical_elements:
-                self.historical_elements[key].set_visible(False)
-            # Show and update status fields
-            for key in ['status_text', 'current_val', 'baseline_diff', 'alert', 'device_info', 'packet_count']:
-                if key in self.lines:
-                    self.lines[key].set_visible(True)
-                else:
-                    print(f"DEBUG: Warning - {key} not found in self.lines", flush=True)
+            if self._lower_right_panel != 'status':
+                ax.clear()  # Clear any previous plot lines, legends, or artifacts
+                ax.set_title('Status & Alerts', fontweight='bold')
+                ax.axis('off')
+                # Re-create status text objects if missing (after ax.clear())
+                for key, props in [
+                    ('status_text', dict(x=0.1, y=0.8, s='Connecting...', fontsize=16, color='orange', fontweight='bold')),
+                    ('current_val', dict(x=0.1, y=0.6, s='', fontsize=14, color='black', fontweight='bold')),
+                    ('baseline_diff', dict(x=0.1, y=0.4, s='', fontsize=14, color='black', fontweight='bold')),
+                    ('alert', dict(x=0.1, y=0.2, s='', fontsize=16, color='green', fontweight='bold')),
+                    # Hangs down from the top, so it stays inside the blitted axes
+                    ('device_info', dict(x=0.1, y=0.95, s='', fontsize=12, color='blue', fontweight='bold', va='top')),
+                    ('packet_count', dict(x=0.1, y=0.05, s='', fontsize=12, color='purple', fontweight='bold'))
+                ]:
+                    if key not in self.lines or self.lines[key] not in ax.texts:
+                        # Blitted like the data lines, so kept out of the background
+                        self.lines[key] = ax.text(props['x'], props['y'], props['s'], fontsize=props['fontsize'],
+                                                  transform=ax.transAxes, color=props['color'], fontweight=props['fontweight'],
+                                                  va=props.get('va', 'baseline'),
+                                                  animated='acc' in self.lines and self.lines['acc'].get_animated())
+                        # Only print debug for text creation occasionally, and not in slow animation mode
+                        if (not hasattr(self, '_slow_animation_mode') or not self._slow_animation_mode) and \
+                           (not hasattr(self, '_last_text_creation_time') or time.time() - self._last_text_creation_time > 2.0):
+                            print(f"DEBUG: Re-created text objects for status panel", flush=True)
+                            self._last_text_creation_time = time.time()
+                # Hide all historical elements
+                for key in self.historical_elements:
+                    self.historical_elements[key].set_visible(False)
+                # Show status fields
+                for key in ['status_text', 'current_val', 'baseline_diff', 'alert', 'device_info', 'packet_count']:
+                    if key in self.lines:
+                        self.lines[key].set_visible(True)
+                    else:
+                        print(f"DEBUG: Warning - {key} not found in self.lines", flush=True)
+                # Fresh text objects: everything has to be set again
+                self._text_cache.clear()
+                self._last_pkt_update = 0.0
+                self._lower_right_panel = 'status'
             
             # Only print status panel debug info occasionally, and not in slow animation mode
             if (not hasattr(self, '_slow_animation_mode') or not self._slow_animation_mode) and \
@@ -939,7 +1281,7 @@ class LiveVibrationMonitor:
                 self._last_status_debug_time = time.time()
             if len(self.acc_total) > 0:
                 # Update status text fields
-                recent_acc = list(self.acc_total)[-30:]
+                recent_acc = self.acc_total[-30:]
                 current_mean = np.mean(recent_acc)
                 current_peak = np.max(recent_acc)
                 current_std = np.std(recent_acc)
@@ -954,7 +1296,7 @@ class LiveVibrationMonitor:
                 
                 if 'current_val' in self.lines:
                     current_text = f"Current Mean: {current_mean:.3f}g\nCurrent Peak: {current_peak:.3f}g"
-                    self.lines['current_val'].set_text(current_text)
+                    self._set_status_text('current_val', current_text)
                     if should_print_status:
                         print(f"DEBUG: Set current_val to: {current_text}", flush=True)
                 
@@ -963,38 +1305,33 @@ class LiveVibrationMonitor:
                 diff_percent = (diff / baseline) * 100
                 if 'baseline_diff' in self.lines:
                     baseline_text = f"vs Idle (1.01g): {diff:+.3f}g ({diff_percent:+.1f}%)"
-                    self.lines['baseline_diff'].set_text(baseline_text)
+                    self._set_status_text('baseline_diff', baseline_text)
                     if should_print_status:
                         print(f"DEBUG: Set baseline_diff to: {baseline_text}", flush=True)
                 
                 # Device info
                 devinfo = f"Device: {self.device_name or 'N/A'}\nMAC: {self.device_mac or 'N/A'}"
                 if 'device_info' in self.lines:
-                    self.lines['device_info'].set_text(devinfo)
+                    self._set_status_text('device_info', devinfo)
                     if should_print_status:
                         print(f"DEBUG: Set device_info to: {devinfo}", flush=True)
                 
-                if 'packet_count' in self.lines:
+                # The packet count changes every batch; show it once per second
+                now = time.time()
+                if 'packet_count' in self.lines and now - self._last_pkt_update >= 1.0:
+                    self._last_pkt_update = now
                     packet_text = f"Packets: {self.packet_count}"
-                    self.lines['packet_count'].set_text(packet_text)
+                    self._set_status_text('packet_count', packet_text)
                     if should_print_status:
                         print(f"DEBUG: Set packet_count to: {packet_text}", flush=True)
                 
                 # Alert logic
                 if 'alert' in self.lines:
-                    if current_mean > 1.23:
-                        self.lines['alert'].set_text("ALERT: Vibration High!")
-                        self.lines['alert'].set_color('red')
-                    elif current_mean > 1.03:
-                        self.lines['alert'].set_text("Warning: Above Cruise")
-                        self.lines['alert'].set_color('orange')
-                    else:
-                        self.lines['alert'].set_text("")
-                        self.lines['alert'].set_color('black')
+                    alert_text, alert_color = _ALERT_LEVELS[bisect.bisect_left(_ALERT_BOUNDS, current_mean)]
+                    self._set_status_text('alert', alert_text, alert_color)
                 
                 if 'status_text' in self.lines:
-                    self.lines['status_text'].set_text("")
-                    self.lines['status_text'].set_color('black')
+                    self._set_status_text('status_text', "", 'black')
                 
                 if should_print_status:
                     print(f"DEBUG: Status panel updated: mean={current_mean:.3f}, peak={current_peak:.3f}", flush=True)
@@ -1009,22 +1346,25 @@ class LiveVibrationMonitor:
                 for key in ['current_val', 'baseline_diff', 'device_info', 'packet_count', 'alert']:
                     if key in self.lines:
                         if key == 'current_val':
-                            self.lines[key].set_text("Click 'Scan BLE Devices' to start")
+                            self._set_status_text(key, "Click 'Scan BLE Devices' to start")
+                        elif key == 'alert':
+                            self._set_status_text(key, "", 'black')
                         else:
-                            self.lines[key].set_text("")
-                        if key == 'alert':
-                            self.lines[key].set_color('black')
+                            self._set_status_text(key, "")
                 if 'status_text' in self.lines:
-                    self.lines['status_text'].set_text("Waiting for connection...")
-                    self.lines['status_text'].set_color('blue')
+                    self._set_status_text('status_text', "Waiting for connection...", 'blue')
                 
                 # Only print status message occasionally, and not in slow animation mode
                 if (not hasattr(self, '_slow_animation_mode') or not self._slow_animation_mode) and \
                    (not hasattr(self, '_last_status_message_time') or time.time() - self._last_status_message_time > 5.0):
                     print("DEBUG: Status panel: Waiting for connection...", flush=True)
                     self._last_status_message_time = time.time()
-        else:
-            # HISTORICAL PANEL
+        elif self._lower_right_panel != 'historical' or self._log_key(VIBRATION_LOG_FILE) != self._historical_key:
+            # HISTORICAL PANEL (static: redrawn when switching to it or
+            # when a reading has been logged since)
+            self._lower_right_panel = 'historical'
+            log_path = VIBRATION_LOG_FILE
+            self._historical_key = self._log_key(log_path)
             ax.clear()
             ax.set_title('Historical Comparison', fontweight='bold')
             ax.set_ylabel('Mean Acceleration (g)')
@@ -1034,20 +1374,16 @@ class LiveVibrationMonitor:
                 self.lines[key].set_visible(False)
             for key in self.historical_elements:
                 self.historical_elements[key].set_visible(False)
-            import pandas as pd
-            log_path = 'vibration_log.csv'  # Fixed: Use correct path in root directory
             has_data = False
             if os.path.exists(log_path):
                 try:
-                    df = pd.read_csv(log_path)
-                    print(f"DEBUG: Historical data - loaded CSV with columns: {list(df.columns)}", flush=True)
-                    print(f"DEBUG: Historical data - CSV has {len(df)} rows", flush=True)
-                    if not df.empty and 'Timestamp' in df.columns and 'Mean_Acc_g' in df.columns:
+                    log = self.load_mean_log(log_path)
+                    print(f"DEBUG: Historical data - CSV has {0 if log is None else len(log)} rows", flush=True)
+                    if log is not None and len(log):
                         has_data = True
-                        df['timestamp'] = pd.to_datetime(df['Timestamp'], errors='coerce')
-                        df = df.dropna(subset=['timestamp'])
-                        if not df.empty:
-                            ax.plot(df['timestamp'], df['Mean_Acc_g'], 'o-', color='blue', 
+                        log = log[~np.isnat(log['timestamp'])]
+                        if len(log):
+                            ax.plot(log['timestamp'], log['mean_acc'], 'o-', color='blue', 
                                    label='Historical Data', markersize=6, linewidth=2)
                             ax.axhline(1.01, color='green', linestyle='--', linewidth=1, 
                                       label='Idle Baseline (1.01g)', alpha=0.7)
@@ -1076,17 +1412,40 @@ class LiveVibrationMonitor:
     def update_plot(self, frame):
         if self.replaying_test:
             self.feed_test_data()
+        changed = False
         message = self.messenger.get_message()
-        if message:
+        while message:
             self.handle_message(message)
-        self.load_latest_data()
-        status = self.messenger.get_status()
-        self.is_connected = status.get('connected', False)
-        self.device_name = status.get('device_name')
-        self.device_mac = status.get('device_mac')
+            changed = True
+            message = self.messenger.get_message()
+        # Samples and status are only re-read when the BLE side changed them
+        if self.messenger.cursor != self._cursor_seen:
+            self.load_latest_data()
+            changed = True
+        status_seq = self.messenger.status_seq
+        if status_seq != self._status_seq_seen:
+            self._status_seq_seen = status_seq
+            changed = True
+            status = self.messenger.get_status()
+            self.is_connected = status.get('connected', False)
+            self.device_name = status.get('device_name')
+            self.device_mac = status.get('device_mac')
+        # Nothing new from the BLE side: every artist already shows the
+        # current state, unless the status panel's packet count is behind
+        # and its once a second throttle lets it be refreshed
+        if not changed:
+            shown = self._text_cache.get('packet_count', ('',))[0]
+            count_behind = (self.show_status and len(self.acc_total) > 0
+                            and shown != f"Packets: {self.packet_count}")
+            if not count_behind or time.time() - self._last_pkt_update < 1.0:
+                return self._blit_artists()
+        # Every panel below works on views of the last 100 samples
+        count = len(self.acc_total)
+        recent = self.acc_total[-100:]
+        window = len(recent)
         
         # Detect disconnection and reduce update frequency
-        if not self.is_connected and len(self.acc_total) == 0:
+        if not self.is_connected and count == 0:
             # No connection and no data - reduce animation frequency to save resources
             if not hasattr(self, '_slow_animation_mode'):
                 self._slow_animation_mode = True
@@ -1094,7 +1453,7 @@ class LiveVibrationMonitor:
                 # Adjust animation interval to 1 second when disconnected
                 if hasattr(self, 'ani') and self.ani:
                     self.ani.event_source.interval = 1000  # 1 second
-        elif self.is_connected or len(self.acc_total) > 0:
+        elif self.is_connected or count > 0:
             # Connected or has data - use normal animation frequency
             if hasattr(self, '_slow_animation_mode') and self._slow_animation_mode:
                 self._slow_animation_mode = False
@@ -1102,133 +1461,46 @@ class LiveVibrationMonitor:
                 # Restore normal animation interval
                 if hasattr(self, 'ani') and self.ani:
                     self.ani.event_source.interval = 100  # 100ms
-        # --- LIVE REFERENCE LINES ---
         ax_live = self.axes[0, 0]
-        # Remove previous reference lines
-        for ref_line in getattr(self, 'reference_lines', []):
-            try:
-                ref_line.remove()
-            except Exception:
-                pass
-        self.reference_lines = []
-        idle = 1.01
-        cruise = 1.03
-        warn = 1.23
         # --- MAIN PLOT DATA ---
-        if len(self.timestamps) > 0:
-            window = min(100, len(self.timestamps))
-            recent_times = list(self.timestamps)[-window:]
-            recent_acc = list(self.acc_total)[-window:]
-            x_data = list(range(len(recent_acc)))
-            self.lines['acc'].set_data(x_data, recent_acc)
-            if len(recent_acc) > 0:
-                # Only update y-axis limits if data exceeds current bounds
-                current_ylim = ax_live.get_ylim()
-                data_min = min(recent_acc)
-                data_max = max(recent_acc)
-                
-                # Add small margin for better visualization
-                margin = 0.02
-                new_y_min = data_min - margin
-                new_y_max = data_max + margin
-                
-                # Only update if data exceeds current bounds
-                if new_y_min < current_ylim[0] or new_y_max > current_ylim[1]:
-                    ax_live.set_ylim(new_y_min, new_y_max)
-                
-                # Set x-axis limits
-                ax_live.set_xlim(0, window)
-            print(f"DEBUG: acc plot updated with {len(recent_acc)} points", flush=True)
+        if count > 0:
+            self.lines['acc'].set_data(self._x100[:window], recent)
+            # Only update y-axis limits if data exceeds current bounds
+            # (with a small margin for better visualization)
+            self._expand_ylim(ax_live, recent.min(), recent.max(), margin=0.02)
+            self._set_xlim(ax_live, window)
+            print(f"DEBUG: acc plot updated with {window} points", flush=True)
         # --- END MAIN PLOT DATA ---
-        # Add reference lines after main plot line
-        self.reference_lines.append(ax_live.axhline(idle, color='blue', linestyle='--', linewidth=1, label='Idle Baseline (1.01g)'))
-        self.reference_lines.append(ax_live.axhline(cruise, color='orange', linestyle='--', linewidth=1, label='Cruise Baseline (1.03g)'))
-        self.reference_lines.append(ax_live.axhline(warn, color='red', linestyle='--', linewidth=1, label='Warning Threshold (1.23g)'))
-        # Ensure main plot line is present
-        if self.lines['acc'] not in ax_live.lines:
-            ax_live.add_line(self.lines['acc'])
-            print("DEBUG: Re-added main plot line to axes", flush=True)
-        handles, labels = ax_live.get_legend_handles_labels()
-        by_label = dict(zip(labels, handles))
-        ax_live.legend(by_label.values(), by_label.keys())
-        # --- END LIVE REFERENCE LINES ---
         # --- ROLLING MEAN & PEAK ---
+        # Statistics of every 30-sample window of the last 100 samples, in
+        # linear time (running sums and a max deque with numba, otherwise
+        # prefix sums and a blocked running max)
+        win_size = 30
+        alpha = 0.2  # EMA smoothing factor
+        window_means, window_stds, peaks = rolling_stats(recent, win_size)
+        x_vals = self._x100[win_size // 2:win_size // 2 + len(peaks)]
+        
         ax_mean = self.axes[0, 1]
-        if len(self.acc_total) > 0:
-            window = min(100, len(self.acc_total))
-            win_size = 30
-            means = []
-            peaks = []
-            x_vals = []
-            acc_list = list(self.acc_total)[-window:]
-            alpha = 0.2  # EMA smoothing factor
-            ema_mean = None
-            for i in range(window - win_size + 1):
-                win = acc_list[i:i+win_size]
-                mean = np.mean(win)
-                peak = np.max(win)
-                if ema_mean is None:
-                    ema_mean = mean
-                else:
-                    ema_mean = alpha * mean + (1 - alpha) * ema_mean
-                means.append(ema_mean)
-                peaks.append(peak)
-                x_vals.append(i + win_size // 2)
+        if count > 0:
+            means = exponential_smooth(window_means, alpha)
             self.lines['mean'].set_data(x_vals, means)
             self.lines['peak'].set_data(x_vals, peaks)
-            if means and peaks:
-                ax_mean.set_xlim(0, window)
+            if len(means):
+                self._set_xlim(ax_mean, window)
                 
                 # Only update y-axis limits if data exceeds current bounds
-                current_ylim = ax_mean.get_ylim()
-                data_min = min(means + peaks)
-                data_max = max(means + peaks)
-                
-                # Add small margin for better visualization
-                margin = 0.02
-                new_y_min = data_min - margin
-                new_y_max = data_max + margin
-                
-                # Only update if data exceeds current bounds
-                if new_y_min < current_ylim[0] or new_y_max > current_ylim[1]:
-                    ax_mean.set_ylim(new_y_min, new_y_max)
+                self._expand_ylim(ax_mean, min(means.min(), peaks.min()), max(means.max(), peaks.max()), margin=0.02)
 
         # --- ROLLING STD DEV ---
         ax_std = self.axes[1, 0]
-        if len(self.acc_total) > 0:
-            window = min(100, len(self.acc_total))
-            win_size = 30
-            stds = []
-            x_vals = []
-            acc_list = list(self.acc_total)[-window:]
-            alpha = 0.2
-            ema_std = None
-            for i in range(window - win_size + 1):
-                win = acc_list[i:i+win_size]
-                std = np.std(win)
-                if ema_std is None:
-                    ema_std = std
-                else:
-                    ema_std = alpha * std + (1 - alpha) * ema_std
-                stds.append(ema_std)
-                x_vals.append(i + win_size // 2)
+        if count > 0:
+            stds = exponential_smooth(window_stds, alpha)
             self.lines['std'].set_data(x_vals, stds)
-            if stds:
-                ax_std.set_xlim(0, window)
+            if len(stds):
+                self._set_xlim(ax_std, window)
                 
                 # Only update y-axis limits if data exceeds current bounds
-                current_ylim = ax_std.get_ylim()
-                data_min = min(stds)
-                data_max = max(stds)
-                
-                # Add small margin for better visualization
-                margin = 0.01
-                new_y_min = data_min - margin
-                new_y_max = data_max + margin
-                
-                # Only update if data exceeds current bounds
-                if new_y_min < current_ylim[0] or new_y_max > current_ylim[1]:
-                    ax_std.set_ylim(new_y_min, new_y_max)
+                self._expand_ylim(ax_std, stds.min(), stds.max(), margin=0.01)
 
         # --- MANUAL DATA LOGGING ---
         # Removed automatic periodic logging - now uses manual "Log Data Point" button
@@ -1238,7 +1510,44 @@ class LiveVibrationMonitor:
         # Status panel is now only updated in update_lower_right() below
         # --- END STATUS PANEL DETAILS ---
         self.update_lower_right()
-        return self.lines.values()
+        return self._blit_artists()
+    
+    def _blit_artists(self):
+        """Artists FuncAnimation blits each frame, after a full redraw if anything else changed"""
+        # Blitted (animated) artists don't mark the figure stale, so it only
+        # is when the background changed: axis limits, button labels, panels
+        if self.fig.stale and self.lines['acc'].get_animated():
+            self.fig.canvas.draw()
+        artists = [self.lines['acc'], self.lines['mean'], self.lines['peak'], self.lines['std']]
+        if self.show_status:
+            artists += [self.lines[key] for key in ('status_text', 'current_val', 'baseline_diff',
+                                                    'alert', 'device_info', 'packet_count')]
+        return artists
+    
+    def _set_status_text(self, key, text, color=None):
+        """Set a status panel text (and color) only when it differs from what is shown"""
+        if self._text_cache.get(key) == (text, color):
+            return
+        self._text_cache[key] = (text, color)
+        artist = self.lines[key]
+        artist.set_text(text)
+        if color is not None:
+            artist.set_color(color)
+    
+    def _expand_ylim(self, ax, data_min, data_max, margin):
+        """Reset y limits to the data +- margin once it gets within margin / 2 of either limit"""
+        # Smaller moves are skipped: the data is still inside the axes, and
+        # every set_ylim invalidates the cached axes background
+        lo, hi = ax.get_ylim()
+        new_y_min = data_min - margin
+        new_y_max = data_max + margin
+        if new_y_min < lo - margin / 2 or new_y_max > hi + margin / 2:
+            ax.set_ylim(new_y_min, new_y_max)
+    
+    def _set_xlim(self, ax, length):
+        """Set x limits to (0, length) unless they already are"""
+        if ax.get_xlim() != (0, length):
+            ax.set_xlim(0, length)
     
     def handle_message(self, message):
         """Handle messages from BLE thread"""
@@ -1258,36 +1567,31 @@ class LiveVibrationMonitor:
             print(f"BLE error: {data.get('error')}", flush=True)
     
     def load_latest_data(self):
-        """Load latest data from file and update local storage"""
+        """Load latest data from the messenger and update local storage"""
         try:
-            latest_data = self.messenger.get_latest_data(max_points=200)
+            self._cursor_seen = self.messenger.cursor
+            samples = self.messenger.get_latest_data(max_points=200)
+            values = samples['acc']
+            times = samples['t']
             
             # Only print debug info if we have data or if this is a significant change
-            if latest_data:
-                if not hasattr(self, '_last_data_count') or self._last_data_count != len(latest_data):
-                    print(f"DEBUG: load_latest_data - loaded {len(latest_data)} points from file", flush=True)
-                    print(f"DEBUG: load_latest_data - first data point: {latest_data[0]}", flush=True)
-                    print(f"DEBUG: load_latest_data - last data point: {latest_data[-1]}", flush=True)
-                    self._last_data_count = len(latest_data)
+            if len(values):
+                if not hasattr(self, '_last_data_count') or self._last_data_count != len(values):
+                    print(f"DEBUG: load_latest_data - loaded {len(values)} points from messenger", flush=True)
+                    print(f"DEBUG: load_latest_data - first data point: {monotonic_to_datetime64(times[0])} {values[0]}", flush=True)
+                    print(f"DEBUG: load_latest_data - last data point: {monotonic_to_datetime64(times[-1])} {values[-1]}", flush=True)
+                    self._last_data_count = len(values)
             else:
                 # Only print "no data" message occasionally to reduce spam, and not in slow animation mode
                 if (not hasattr(self, '_slow_animation_mode') or not self._slow_animation_mode) and \
                    (not hasattr(self, '_last_no_data_time') or time.time() - self._last_no_data_time > 5.0):
-                    print(f"DEBUG: load_latest_data - no data loaded from file (will suppress for 5s)", flush=True)
+                    print(f"DEBUG: load_latest_data - no data loaded from messenger (will suppress for 5s)", flush=True)
                     self._last_no_data_time = time.time()
             
-            self.timestamps.clear()
-            self.acc_data.clear()
-            self.acc_total.clear()
-            for data_point in latest_data:
-                try:
-                    timestamp = datetime.fromisoformat(data_point['timestamp'])
-                    self.timestamps.append(timestamp)
-                    self.acc_data.append([data_point['acc_x'], data_point['acc_y'], data_point['acc_z']])
-                    self.acc_total.append(data_point['acc_total'])
-                except Exception as e:
-                    print(f"DEBUG: load_latest_data - error parsing data_point: {data_point}, error: {e}", flush=True)
-                    continue
+            # Column views of the copied rows; no per-sample conversion
+            self.timestamps = times
+            self.acc_data = values[:, :3]
+            self.acc_total = values[:, 3]
             # Set connected True if we have data
             if len(self.acc_total) > 0:
                 if not self.connected:
@@ -1402,10 +1706,9 @@ class LiveVibrationMonitor:
             self.test_start_time = now
         elapsed = now - self.test_start_time
         idx = int((elapsed * len(self.test_data)) / 60) % len(self.test_data)
-        data_point = self.test_data[idx]
-        self.timestamps.append(datetime.fromisoformat(data_point['timestamp']))
-        self.acc_data.append([data_point['acc_x'], data_point['acc_y'], data_point['acc_z']])
-        self.acc_total.append(data_point['acc_total'])
+        # Replayed samples go through the messenger like live ones, so
+        # load_latest_data picks them up
+        self.messenger.save_data_batch(samples_from_records(self.test_data[idx:idx + 1], time.monotonic_ns()))
 
     def capture_test_data(self):
         print("Capturing 1 minute of data for test mode...", flush=True)
@@ -1413,12 +1716,13 @@ class LiveVibrationMonitor:
         start = time.time()
         while time.time() - start < 60:
             if len(self.acc_total) > 0:
+                acc_x, acc_y, acc_z = self.acc_data[-1].tolist()
                 captured.append({
                     'timestamp': datetime.now().isoformat(),
-                    'acc_x': self.acc_data[-1][0],
-                    'acc_y': self.acc_data[-1][1],
-                    'acc_z': self.acc_data[-1][2],
-                    'acc_total': self.acc_total[-1]
+                    'acc_x': acc_x,
+                    'acc_y': acc_y,
+                    'acc_z': acc_z,
+                    'acc_total': float(self.acc_total[-1])
                 })
             time.sleep(0.05)
         with open(TEST_CAPTURE_FILE, 'w') as f:
@@ -1473,7 +1777,7 @@ async def main():
     """Main function"""
     print("=== Allora Yacht - Live Vibration Monitor v2 ===", flush=True)
     print("Connecting to WT901BLE68 for real-time vibration monitoring...", flush=True)
-    print("Using background BLE threading with file-based messaging", flush=True)
+    print("Using background BLE threading with in-memory messaging", flush=True)
     
     # Load baseline data
     monitor = LiveVibrationMonitor()
@@ -1489,20 +1793,14 @@ async def main():
     monitor.data_source_status = 'Waiting for connection...'
     monitor.update_data_source_status()
     
-    monitor.ani = animation.FuncAnimation(monitor.fig, monitor.update_plot, interval=100, blit=False)
+    monitor.ani = animation.FuncAnimation(monitor.fig, monitor.update_plot, interval=100, blit=True,
+                                          cache_frame_data=False)
     try:
         plt.show()
     except KeyboardInterrupt:
         print("\nStopping...", flush=True)
     finally:
         monitor.stop_ble_thread()
-        # Clean up message files
-        for file in [MESSAGE_FILE, STATUS_FILE, DATA_FILE]:
-            if os.path.exists(file):
-                try:
-                    os.remove(file)
-                except:
-                    pass
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="WT901BLE68 Live Vibration Monitor v2")
@@ -1528,7 +1826,8 @@ if __name__ == "__main__":
         monitor.setup_plot()
         monitor.update_button_label()  # Ensure button label is correct after setup
         monitor.update_lower_right()  # Initialize the lower right panel
-        monitor.ani = animation.FuncAnimation(monitor.fig, monitor.update_plot, interval=100, blit=False)
+        monitor.ani = animation.FuncAnimation(monitor.fig, monitor.update_plot, interval=100, blit=True,
+                                              cache_frame_data=False)
         plt.show()
     else:
         asyncio.run(main()) 
\ No newline at end of file